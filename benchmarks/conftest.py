@@ -0,0 +1,190 @@
+"""Shared fixtures for the HTTP Request benchmarks.
+
+Run with (benchmarks/pytest.ini sets the asyncio mode the hass fixture needs):
+
+    pip install pytest-benchmark pytest-homeassistant-custom-component
+    pytest benchmarks --benchmark-only
+
+Payloads are synthetic and deterministic, so results are comparable between
+runs and machines (use --benchmark-save / --benchmark-compare).
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import lru_cache, partial
+import json
+from pathlib import Path
+import sys
+from typing import Any
+
+import pytest
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+    import pytest_benchmark  # noqa: F401
+    import pytest_homeassistant_custom_component  # noqa: F401
+except ImportError:
+    # Nothing to run without pytest-benchmark and the Home Assistant test plugin
+    collect_ignore_glob = ["test_*.py"]
+
+# Make custom_components importable without installing the integration
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+KB = 1024
+MB = 1024 * KB
+
+PAYLOAD_SIZES = {"1kb": KB, "100kb": 100 * KB, "10mb": 10 * MB}
+SENSOR_COUNTS = (1, 10, 100)
+RESPONSE_TYPES = ("json", "html", "text")
+
+# Rounds for payloads that take seconds per call; smaller ones are calibrated
+LARGE_PAYLOAD_ROUNDS = 3
+
+
+def _json_item(idx: int) -> dict[str, Any]:
+    return {"id": idx, "name": f"item-{idx}", "value": idx * 1.5, "tags": ["a", "b"]}
+
+
+def _html_item(idx: int) -> str:
+    return f'<li class="item-{idx}" data-id="{idx}"><span>{idx * 1.5}</span></li>'
+
+
+def _text_item(idx: int) -> str:
+    return f"value_{idx}={idx * 1.5}\n"
+
+
+@lru_cache(maxsize=None)
+def make_payload(response_type: str, size: int) -> tuple[str, int]:
+    """Return a payload of about `size` bytes and the number of items in it."""
+    if response_type == "json":
+        # Every item serializes to the same width +/- a few digits
+        item_size = len(json.dumps(_json_item(0))) + 2
+        count = max(1, size // item_size)
+        return json.dumps({"items": [_json_item(idx) for idx in range(count)]}), count
+
+    if response_type == "html":
+        wrapper = "<html><body><ul>{}</ul></body></html>"
+        count = max(1, (size - len(wrapper)) // len(_html_item(0)))
+        return wrapper.format("".join(_html_item(idx) for idx in range(count))), count
+
+    count = max(1, size // len(_text_item(0)))
+    return "".join(_text_item(idx) for idx in range(count)), count
+
+
+def make_sensors(response_type: str, sensor_count: int, item_count: int) -> list[dict[str, Any]]:
+    """Return sensor configurations that each read a different item."""
+    sensors = []
+    for idx in range(sensor_count):
+        item = idx % item_count
+        sensor: dict[str, Any] = {"name": f"Sensor {idx}"}
+        if response_type == "json":
+            sensor["json_path"] = f"items[{item}].value"
+        elif response_type == "html":
+            sensor["html_selector"] = f"li.item-{item} span"
+            sensor["html_value_type"] = "value"
+        else:
+            sensor["text_regex"] = rf"value_{item}=([\d.]+)"
+            sensor["text_group_count"] = 1
+        sensors.append(sensor)
+    return sensors
+
+
+def rounds_for(size: int) -> dict[str, int]:
+    """Return pedantic arguments for large payloads (empty means calibrate)."""
+    if size >= MB:
+        return {"rounds": LARGE_PAYLOAD_ROUNDS, "iterations": 1, "warmup_rounds": 0}
+    return {}
+
+
+def run_benchmark(benchmark, func: Callable[..., Any], *args: Any, size: int = 0) -> Any:
+    """Benchmark a synchronous call, limiting rounds for large payloads."""
+    if pedantic := rounds_for(size):
+        return benchmark.pedantic(func, args=args, **pedantic)
+    return benchmark(func, *args)
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the load test options."""
+    group = parser.getgroup("load", "HTTP Request load test")
+    group.addoption("--load-entries", type=int, default=50, help="Config entries to create")
+    group.addoption("--load-sensors", type=int, default=5, help="Sensors per entry")
+    group.addoption("--load-duration", type=float, default=60.0, help="Seconds to run")
+    group.addoption("--load-interval", type=int, default=10, help="Scan interval of each entry (s)")
+    group.addoption("--load-latency", type=float, default=50.0, help="Mean server latency (ms)")
+    group.addoption("--load-size", type=int, default=10 * KB, help="Response size (bytes)")
+    group.addoption("--load-error-rate", type=float, default=0.05, help="Share of 503 responses")
+    group.addoption("--load-timeout-rate", type=float, default=0.01, help="Share of timeouts")
+    group.addoption("--load-reset-rate", type=float, default=0.01, help="Share of connection resets")
+    group.addoption("--load-timeout", type=int, default=5, help="Request timeout of each entry (s)")
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading the integration from custom_components."""
+    yield
+
+
+@pytest.fixture
+def async_benchmark(hass, benchmark):
+    """Benchmark a coroutine function on the running event loop.
+
+    pytest-benchmark only times synchronous calls, so the timer runs in an
+    executor thread and each round waits for the coroutine on hass.loop. The
+    thread hop adds the same small constant to every round.
+    """
+
+    async def _run(func: Callable[[], Awaitable[Any]], size: int = 0) -> Any:
+        def _round() -> Any:
+            return asyncio.run_coroutine_threadsafe(func(), hass.loop).result()
+
+        return await hass.async_add_executor_job(
+            partial(run_benchmark, benchmark, _round, size=size)
+        )
+
+    return _run
+
+
+def versioned_payload(response_type: str, size: int, counter: int) -> str:
+    """Return the payload with a counter, so every response has a new body."""
+    payload, _ = make_payload(response_type, size)
+    if response_type == "json":
+        return f'{{"counter": {counter}, {payload[1:]}'
+    if response_type == "html":
+        return payload.replace("<body>", f"<body><p>{counter}</p>", 1)
+    return f"counter={counter}\n{payload}"
+
+
+@pytest.fixture
+async def payload_server(socket_enabled):
+    """Serve the synthetic payloads from a local aiohttp test server.
+
+    GET /{response_type}/{size} returns the payload, e.g. /json/100kb. The
+    body changes on every request, so each refresh parses it again.
+    """
+    content_types = {
+        "json": "application/json",
+        "html": "text/html",
+        "text": "text/plain",
+    }
+    counter = 0
+
+    async def handle(request: web.Request) -> web.Response:
+        nonlocal counter
+        counter += 1
+        response_type = request.match_info["response_type"]
+        size = PAYLOAD_SIZES[request.match_info["size"]]
+        return web.Response(
+            text=versioned_payload(response_type, size, counter),
+            content_type=content_types[response_type],
+        )
+
+    app = web.Application()
+    app.router.add_get("/{response_type}/{size}", handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
@@ -0,0 +1,162 @@
+"""Mock HTTP server for the load test.
+
+The server runs in its own process, so the CPU time it spends serving
+responses is not counted as the integration's process time.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import multiprocessing
+from multiprocessing.connection import Connection
+import random
+import socket
+import struct
+from typing import Any
+
+from aiohttp import web
+
+# Failures the server injects, besides successful responses
+ERROR_KINDS = ("server_error", "timeout", "reset")
+
+
+def _body(counter: int, values: int, padding: str) -> str:
+    return json.dumps(
+        {"counter": counter, "values": [counter + idx for idx in range(values)], "padding": padding}
+    )
+
+
+def _reset(request: web.Request) -> None:
+    """Close the connection with a TCP reset instead of a response."""
+    transport = request.transport
+    if transport is None:
+        return
+    sock = transport.get_extra_info("socket")
+    if sock is not None:
+        # Linger 0: close() sends RST instead of FIN
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, struct.pack("ii", 1, 0))
+    transport.close()
+
+
+async def _async_serve(config: dict[str, Any], stats: dict[str, Any], conn: Connection) -> None:
+    """Serve until the process is terminated, sending the port over conn."""
+    padding = "x" * max(0, config["size"] - len(_body(0, config["values"], "")))
+    counter = 0
+
+    async def handle(request: web.Request) -> web.StreamResponse:
+        nonlocal counter
+        stats["requests"].value += 1
+        await asyncio.sleep(config["latency"] * random.uniform(0.5, 1.5))
+
+        # One roll picks success or one of the failure kinds
+        roll = random.random()
+        for kind in ERROR_KINDS:
+            if roll < config[kind]:
+                stats[kind].value += 1
+                break
+            roll -= config[kind]
+        else:
+            kind = None
+
+        if kind == "server_error":
+            return web.Response(status=503, text="Service Unavailable")
+        if kind == "timeout":
+            # Answer only after the client has given up
+            await asyncio.sleep(config["client_timeout"] + 1)
+        elif kind == "reset":
+            _reset(request)
+            return web.Response(status=503)
+
+        counter += 1
+        return web.Response(
+            text=_body(counter, config["values"], padding), content_type="application/json"
+        )
+
+    app = web.Application()
+    app.router.add_get("/entry/{idx}", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    conn.send(runner.addresses[0][1])
+    await asyncio.Event().wait()
+
+
+def _serve(config: dict[str, Any], stats: dict[str, Any], conn: Connection) -> None:
+    # Writing to a reset connection is expected; do not log it
+    logging.getLogger("aiohttp").setLevel(logging.CRITICAL)
+    asyncio.run(_async_serve(config, stats, conn))
+
+
+class MockServer:
+    """HTTP server with configurable latency, size and error mix.
+
+    GET /entry/{idx} returns {"counter": n, "values": [...], "padding": "..."}
+    where the values change on every request, so sensors always get new data.
+    A share of the requests fail instead: an HTTP 503, a response delayed past
+    the client's timeout, or a connection reset.
+    """
+
+    def __init__(
+        self,
+        latency: float,
+        size: int,
+        values: int,
+        error_rate: float,
+        timeout_rate: float,
+        reset_rate: float,
+        client_timeout: float,
+    ) -> None:
+        """Initialize the server (latency and client_timeout in seconds, size in bytes)."""
+        # Spawn: forking the test process would copy its running event loop
+        self._context = multiprocessing.get_context("spawn")
+        self._config = {
+            "latency": latency,
+            "size": size,
+            "values": values,
+            "server_error": error_rate,
+            "timeout": timeout_rate,
+            "reset": reset_rate,
+            "client_timeout": client_timeout,
+        }
+        # Counters shared with the server process
+        self._stats = {name: self._context.Value("i", 0) for name in ("requests", *ERROR_KINDS)}
+        self._process: multiprocessing.process.BaseProcess | None = None
+        self.port: int | None = None
+
+    @property
+    def requests(self) -> int:
+        """Return the number of requests received."""
+        return self._stats["requests"].value
+
+    def errors(self, kind: str) -> int:
+        """Return the number of injected failures of a kind."""
+        return self._stats[kind].value
+
+    def start(self) -> None:
+        """Start serving on a free port."""
+        receiver, sender = self._context.Pipe(duplex=False)
+        self._process = self._context.Process(
+            target=_serve,
+            args=(self._config, self._stats, sender),
+            name="load-test-server",
+            daemon=True,
+        )
+        self._process.start()
+        # The child holds its own copy; recv() fails if the child dies early
+        sender.close()
+        if not receiver.poll(30):
+            self.stop()
+            raise RuntimeError("Load test server did not start")
+        self.port = receiver.recv()
+
+    def stop(self) -> None:
+        """Stop the server process."""
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+
+    def url(self, idx: int) -> str:
+        """Return the URL of an entry."""
+        return f"http://127.0.0.1:{self.port}/entry/{idx}"
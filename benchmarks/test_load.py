@@ -0,0 +1,171 @@
+"""Load test: many config entries polling a local mock server.
+
+Creates N entries with M sensors each through the real entry setup and lets
+their coordinators poll for a while, then reports:
+
+- event loop lag (how late a periodic probe wakes up)
+- CPU time per refresh (process CPU of Home Assistant and its executor threads)
+- memory per entry (traced allocations of setting up an entry)
+- state writes per second (state_changed events of the entry's entities)
+
+Run with e.g.:
+
+    pytest benchmarks/test_load.py -s --load-entries 250 --load-sensors 10 \\
+        --load-latency 200 --load-size 102400 --load-error-rate 0.1 \\
+        --load-timeout-rate 0.02 --load-reset-rate 0.02
+
+The server runs in its own process, so it adds neither to the lag nor to the
+CPU time.
+"""
+from __future__ import annotations
+
+import asyncio
+import statistics
+import time
+import tracemalloc
+from typing import Any
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, HomeAssistant, callback
+
+from custom_components.http_request.const import (
+    CONF_METHOD,
+    CONF_RESPONSE_TYPE,
+    CONF_SCAN_INTERVAL,
+    CONF_TIMEOUT,
+    CONF_URL,
+    DOMAIN,
+)
+
+from .load_server import MockServer
+
+# Interval of the loop lag probe (s)
+PROBE_INTERVAL = 0.1
+
+
+async def _async_probe_lag(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late the loop wakes up a task sleeping PROBE_INTERVAL."""
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL)
+        lags.append(max(0.0, time.perf_counter() - start - PROBE_INTERVAL) * 1000)
+
+
+def _percentile(samples: list[float], percent: int) -> float:
+    if len(samples) < 2:
+        return samples[0] if samples else 0.0
+    # Inclusive: interpolate within the samples, never past the max
+    return statistics.quantiles(samples, n=100, method="inclusive")[percent - 1]
+
+
+async def test_load(
+    hass: HomeAssistant, pytestconfig: pytest.Config, capsys, socket_enabled
+) -> None:
+    """Poll N entries with M sensors and report how the integration scales."""
+    option = pytestconfig.getoption
+    entries = option("--load-entries")
+    sensors = option("--load-sensors")
+    duration = option("--load-duration")
+
+    server = MockServer(
+        latency=option("--load-latency") / 1000,
+        size=option("--load-size"),
+        values=sensors,
+        error_rate=option("--load-error-rate"),
+        timeout_rate=option("--load-timeout-rate"),
+        reset_rate=option("--load-reset-rate"),
+        client_timeout=option("--load-timeout"),
+    )
+    server.start()
+    try:
+        # Setup: traced so the allocations of each entry can be attributed
+        tracemalloc.start()
+        baseline = tracemalloc.get_traced_memory()[0]
+        config_entries: list[MockConfigEntry] = []
+        for idx in range(entries):
+            entry = MockConfigEntry(
+                domain=DOMAIN,
+                title=f"Load {idx}",
+                data={
+                    "service_name": f"Load {idx}",
+                    CONF_URL: server.url(idx),
+                    CONF_METHOD: "GET",
+                    CONF_RESPONSE_TYPE: "json",
+                    CONF_SCAN_INTERVAL: option("--load-interval"),
+                    CONF_TIMEOUT: option("--load-timeout"),
+                    "sensors": [
+                        {"name": f"Value {sensor}", "json_path": f"values[{sensor}]"}
+                        for sensor in range(sensors)
+                    ],
+                },
+            )
+            entry.add_to_hass(hass)
+            await hass.config_entries.async_setup(entry.entry_id)
+            config_entries.append(entry)
+        await hass.async_block_till_done()
+        memory_per_entry = (tracemalloc.get_traced_memory()[0] - baseline) / entries
+        tracemalloc.stop()
+
+        coordinators = [
+            hass.data[DOMAIN][entry.entry_id]["coordinator"] for entry in config_entries
+        ]
+
+        # Load: let the coordinators poll on their own schedule
+        writes = 0
+
+        @callback
+        def _count_write(event: Event) -> None:
+            nonlocal writes
+            writes += 1
+
+        lags: list[float] = []
+        stop = asyncio.Event()
+        probe = hass.async_create_background_task(_async_probe_lag(lags, stop), "load test probe")
+        remove_listener = hass.bus.async_listen(EVENT_STATE_CHANGED, _count_write)
+        requests_before = server.requests
+        cpu_before = time.process_time()
+
+        await asyncio.sleep(duration)
+
+        cpu = time.process_time() - cpu_before
+        refreshes = server.requests - requests_before
+        remove_listener()
+        stop.set()
+        await probe
+
+        report: dict[str, Any] = {
+            "entries": entries,
+            "sensors per entry": sensors,
+            "refreshes": refreshes,
+            "server errors (503)": server.errors("server_error"),
+            "timeouts": server.errors("timeout"),
+            "connection resets": server.errors("reset"),
+            "failing entries": sum(
+                not coordinator.last_update_success for coordinator in coordinators
+            ),
+            "open circuits": sum(
+                coordinator.breaker.state == coordinator.breaker.OPEN
+                for coordinator in coordinators
+            ),
+            "loop lag p50 (ms)": round(_percentile(lags, 50), 2),
+            "loop lag p99 (ms)": round(_percentile(lags, 99), 2),
+            "loop lag max (ms)": round(max(lags, default=0.0), 2),
+            "cpu per refresh (ms)": round(cpu / refreshes * 1000, 3) if refreshes else None,
+            "memory per entry (KB)": round(memory_per_entry / 1024, 1),
+            "state writes per second": round(writes / duration, 1),
+        }
+        with capsys.disabled():
+            print("\nHTTP Request load test")
+            for name, value in report.items():
+                print(f"  {name:<26} {value}")
+
+        assert refreshes > 0
+
+        for entry in config_entries:
+            await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+    finally:
+        server.stop()
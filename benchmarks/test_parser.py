@@ -0,0 +1,77 @@
+"""Benchmarks of the parser functions on synthetic payloads."""
+from __future__ import annotations
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.http_request.parser import (
+    ExtractionPlan,
+    build_document,
+    compile_template,
+    parse_html,
+    parse_json,
+    parse_text_all,
+    render_template,
+)
+
+from .conftest import (
+    PAYLOAD_SIZES,
+    RESPONSE_TYPES,
+    SENSOR_COUNTS,
+    make_payload,
+    make_sensors,
+    run_benchmark,
+)
+
+sizes = pytest.mark.parametrize("size", PAYLOAD_SIZES.values(), ids=PAYLOAD_SIZES.keys())
+
+
+@sizes
+def test_parse_json(benchmark, size: int) -> None:
+    """Decode the whole body and resolve a path near its end."""
+    payload, count = make_payload("json", size)
+    result = run_benchmark(benchmark, parse_json, payload, f"items[{count - 1}].value", size=size)
+    assert result == (count - 1) * 1.5
+
+
+@sizes
+def test_parse_html(benchmark, size: int) -> None:
+    """Build the tree and select an element near its end."""
+    payload, count = make_payload("html", size)
+    result = run_benchmark(
+        benchmark, parse_html, payload, f"li.item-{count - 1} span", "value", size=size
+    )
+    assert result == str((count - 1) * 1.5)
+
+
+@sizes
+def test_parse_text_all(benchmark, size: int) -> None:
+    """Find every match of a regex that matches each line."""
+    payload, count = make_payload("text", size)
+    result = run_benchmark(benchmark, parse_text_all, payload, r"value_(\d+)=", size=size)
+    assert len(result) == count
+
+
+@sizes
+async def test_render_template(hass: HomeAssistant, benchmark, size: int) -> None:
+    """Render a value template against the parsed document."""
+    payload, count = make_payload("json", size)
+    template = compile_template(hass, "{{ value_json['items'] | length }}")
+    variables = {"value": payload, "value_json": parse_json(payload)}
+    result = run_benchmark(benchmark, render_template, hass, template, variables, size=size)
+    assert result == count
+
+
+@sizes
+@pytest.mark.parametrize("sensor_count", SENSOR_COUNTS)
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+def test_build_document(benchmark, response_type: str, size: int, sensor_count: int) -> None:
+    """Parse a body once for all sensors of an entry."""
+    payload, count = make_payload(response_type, size)
+    plan = ExtractionPlan.from_sensors(make_sensors(response_type, sensor_count, count))
+    document = run_benchmark(benchmark, build_document, payload, response_type, plan, size=size)
+    if response_type == "json":
+        assert document.json is not None
+    else:
+        assert document.html_values or document.text_counts
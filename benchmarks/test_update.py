@@ -0,0 +1,93 @@
+"""Benchmarks of a full refresh: fetch, parse once, render every sensor.
+
+Since sensors are pushed by the coordinator, one update cycle is a
+coordinator refresh followed by every sensor's coordinator update.
+"""
+from __future__ import annotations
+
+from aiohttp.test_utils import TestServer
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.http_request.const import (
+    CONF_COALESCE_REQUESTS,
+    CONF_MAX_RESPONSE_SIZE,
+    CONF_METHOD,
+    CONF_REQUEST_JITTER,
+    CONF_RESPONSE_TYPE,
+    CONF_SCAN_INTERVAL,
+    CONF_SKIP_UNCHANGED,
+    CONF_URL,
+    DOMAIN,
+)
+
+from .conftest import (
+    PAYLOAD_SIZES,
+    RESPONSE_TYPES,
+    SENSOR_COUNTS,
+    make_payload,
+    make_sensors,
+)
+
+
+async def _async_setup_entry(
+    hass: HomeAssistant,
+    server: TestServer,
+    response_type: str,
+    size_id: str,
+    sensor_count: int,
+) -> MockConfigEntry:
+    """Set up an entry whose sensors read the served payload."""
+    _, count = make_payload(response_type, PAYLOAD_SIZES[size_id])
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Benchmark",
+        data={
+            "service_name": "Benchmark",
+            CONF_URL: str(server.make_url(f"/{response_type}/{size_id}")),
+            CONF_METHOD: "GET",
+            CONF_RESPONSE_TYPE: response_type,
+            CONF_MAX_RESPONSE_SIZE: 16 * 1024,
+            # Polling is driven by the benchmark, not the interval
+            CONF_SCAN_INTERVAL: 86400,
+            CONF_REQUEST_JITTER: 0,
+            # Every round must fetch and parse the body again
+            CONF_SKIP_UNCHANGED: False,
+            CONF_COALESCE_REQUESTS: False,
+            "sensors": make_sensors(response_type, sensor_count, count),
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+@pytest.mark.parametrize("sensor_count", SENSOR_COUNTS)
+@pytest.mark.parametrize("size_id", PAYLOAD_SIZES)
+@pytest.mark.parametrize("response_type", RESPONSE_TYPES)
+async def test_update_cycle(
+    hass: HomeAssistant,
+    async_benchmark,
+    payload_server: TestServer,
+    response_type: str,
+    size_id: str,
+    sensor_count: int,
+) -> None:
+    """Refresh the coordinator and update every sensor of the entry."""
+    entry = await _async_setup_entry(
+        hass, payload_server, response_type, size_id, sensor_count
+    )
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    await async_benchmark(coordinator.async_refresh, size=PAYLOAD_SIZES[size_id])
+
+    assert coordinator.last_update_success
+    states = hass.states.async_all("sensor")
+    assert len(states) == sensor_count
+    assert all(state.state not in ("unknown", "unavailable") for state in states)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -1,15 +1,27 @@
 """The HTTP Request integration."""
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
-from typing import Any
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable
+from types import SimpleNamespace
+from urllib.parse import urlsplit
+
+import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import Event, HomeAssistant, callback
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import UpdateFailed
+from homeassistant.util.ssl import get_default_context, get_default_no_verify_context
 
-from .const import DOMAIN, MANUFACTURER, MODEL
+from .const import CACHE_STORAGE_VERSION, DOMAIN, DOMAIN_DATA, MANUFACTURER, MODEL
 from .sensor import HttpRequestDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -17,21 +29,413 @@ _LOGGER = logging.getLogger(__name__)
 PLATFORMS: list[Platform] = [Platform.BINARY_SENSOR, Platform.SENSOR]
 
 
+def request_host(url: str) -> str:
+    """Return the host (with port) a request URL is sent to."""
+    return urlsplit(url).netloc.lower()
+
+
+class _HostLimiter:
+    """Concurrency and rate state for one host."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.condition = asyncio.Condition()
+        self.in_flight = 0
+        self.queued = 0
+        # Limits requested by each entry using this host; the strictest applies
+        self.limits: dict[str, tuple[int, float]] = {}
+        # Earliest time (monotonic) the next request may start
+        self.next_start = 0.0
+        # Wait statistics
+        self.requests = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.last_wait = 0.0
+        # Jitter statistics, kept apart from the waits for a slot
+        self.last_jitter = 0.0
+
+    @property
+    def concurrency(self) -> int:
+        """Return the strictest concurrency limit (0 = unlimited)."""
+        limits = [concurrency for concurrency, _ in self.limits.values() if concurrency > 0]
+        return min(limits) if limits else 0
+
+    @property
+    def rate(self) -> float:
+        """Return the strictest rate limit in requests per second (0 = unlimited)."""
+        limits = [rate for _, rate in self.limits.values() if rate > 0]
+        return min(limits) if limits else 0.0
+
+
+class RequestScheduler:
+    """Domain-wide scheduler shared by every HTTP Request entry.
+
+    Requests to the same host are queued so that no more than the host's
+    concurrency limit run at once and they start no faster than its rate
+    limit. When entries disagree, the most restrictive limit wins. Refreshes
+    can also be delayed by a random jitter before they queue, so entries
+    created at the same time (e.g. after a restart) drift apart instead of
+    firing together.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the scheduler."""
+        self._hosts: dict[str, _HostLimiter] = {}
+
+    def register(self, entry_id: str, urls: list[str], concurrency: int, rate: float) -> None:
+        """Register an entry's limits for the hosts it requests."""
+        self.unregister(entry_id)
+        for url in urls:
+            host = request_host(url)
+            limiter = self._hosts.setdefault(host, _HostLimiter())
+            limiter.limits[entry_id] = (concurrency, rate)
+
+    def unregister(self, entry_id: str) -> None:
+        """Remove an entry's limits; idle hosts without entries are dropped."""
+        for host, limiter in list(self._hosts.items()):
+            limiter.limits.pop(entry_id, None)
+            if not limiter.limits and not limiter.in_flight and not limiter.queued:
+                del self._hosts[host]
+
+    async def async_jitter(self, url: str, jitter: float) -> float:
+        """Sleep a random delay of up to `jitter` seconds; return the delay.
+
+        Called before async_slot, so the delay is neither counted as queued
+        nor as time waited for the host.
+        """
+        delay = random.uniform(0, jitter) if jitter > 0 else 0.0
+        if delay:
+            await asyncio.sleep(delay)
+        limiter = self._hosts.get(request_host(url))
+        if limiter is not None:
+            limiter.last_jitter = delay
+        return delay
+
+    @asynccontextmanager
+    async def async_slot(self, url: str) -> AsyncIterator[float]:
+        """Wait for a free slot for a request to this URL's host.
+
+        Yields the time spent waiting (seconds). Requests are never
+        rejected; they queue until the host's limits allow them.
+        """
+        limiter = self._hosts.setdefault(request_host(url), _HostLimiter())
+        start = time.monotonic()
+        limiter.queued += 1
+        try:
+            async with limiter.condition:
+                await limiter.condition.wait_for(
+                    lambda: not limiter.concurrency or limiter.in_flight < limiter.concurrency
+                )
+                limiter.in_flight += 1
+        finally:
+            limiter.queued -= 1
+        
+        try:
+            # Space request starts according to the rate limit
+            if limiter.rate:
+                now = time.monotonic()
+                slot = max(now, limiter.next_start)
+                limiter.next_start = slot + 1 / limiter.rate
+                if slot > now:
+                    await asyncio.sleep(slot - now)
+            
+            wait = time.monotonic() - start
+            limiter.requests += 1
+            limiter.wait_total += wait
+            limiter.wait_max = max(limiter.wait_max, wait)
+            limiter.last_wait = wait
+            yield wait
+        finally:
+            async with limiter.condition:
+                limiter.in_flight -= 1
+                limiter.condition.notify()
+
+    def host_stats(self, url: str) -> dict[str, Any]:
+        """Return queue and wait metrics for a URL's host."""
+        limiter = self._hosts.get(request_host(url))
+        if limiter is None:
+            return {}
+        return {
+            "queue_depth": limiter.queued,
+            "in_flight": limiter.in_flight,
+            "concurrency_limit": limiter.concurrency or None,
+            "rate_limit": limiter.rate or None,
+            "requests": limiter.requests,
+            "wait_last_ms": round(limiter.last_wait * 1000, 2),
+            "wait_avg_ms": round(limiter.wait_total / limiter.requests * 1000, 2) if limiter.requests else 0.0,
+            "wait_max_ms": round(limiter.wait_max * 1000, 2),
+            "jitter_last_ms": round(limiter.last_jitter * 1000, 2),
+        }
+
+
+class ConnectionPools:
+    """Dedicated aiohttp sessions shared by the entries that opt in.
+
+    Entries with the same pool settings share one session and connector, so
+    keep-alive connections to a host are reused across entries. Each pool
+    counts new connections, reused connections and TLS handshakes.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._sessions: dict[tuple, aiohttp.ClientSession] = {}
+        self._stats: dict[tuple, dict[str, int]] = {}
+        # Pool key used by each entry
+        self._entries: dict[str, tuple] = {}
+
+    @callback
+    def async_get_session(
+        self,
+        entry_id: str,
+        verify_ssl: bool,
+        limit_per_host: int,
+        dns_cache_ttl: int,
+        keepalive_timeout: int,
+    ) -> aiohttp.ClientSession:
+        """Return the pooled session for these settings, creating it if needed."""
+        key = (verify_ssl, limit_per_host, dns_cache_ttl, keepalive_timeout)
+        self._entries[entry_id] = key
+        
+        session = self._sessions.get(key)
+        if session is None or session.closed:
+            connector = aiohttp.TCPConnector(
+                ssl=get_default_context() if verify_ssl else get_default_no_verify_context(),
+                limit_per_host=limit_per_host,
+                ttl_dns_cache=dns_cache_ttl,
+                use_dns_cache=dns_cache_ttl > 0,
+                keepalive_timeout=keepalive_timeout,
+                enable_cleanup_closed=True,
+            )
+            stats = {"connections_new": 0, "connections_reused": 0, "tls_handshakes": 0}
+            session = aiohttp.ClientSession(
+                connector=connector,
+                trace_configs=[self._trace_config(stats)],
+            )
+            self._sessions[key] = session
+            self._stats[key] = stats
+        return session
+
+    @staticmethod
+    def _trace_config(stats: dict[str, int]) -> aiohttp.TraceConfig:
+        """Return a trace config counting connection reuse into stats.
+
+        When a request passes a dict as trace_request_ctx, the DNS and
+        connection (TCP and TLS) times of that request are stored in it (ms).
+        """
+        trace_config = aiohttp.TraceConfig()
+
+        def _record(context: SimpleNamespace, stage: str, start: float | None) -> None:
+            if start is not None and isinstance(context.trace_request_ctx, dict):
+                context.trace_request_ctx[stage] = round((time.perf_counter() - start) * 1000, 2)
+
+        async def on_request_start(
+            session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+        ) -> None:
+            context.secure = params.url.scheme == "https"
+
+        async def on_dns_resolvehost_start(
+            session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+        ) -> None:
+            context.dns_start = time.perf_counter()
+
+        async def on_dns_resolvehost_end(
+            session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+        ) -> None:
+            _record(context, "dns", getattr(context, "dns_start", None))
+
+        async def on_connection_create_start(
+            session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+        ) -> None:
+            context.connect_start = time.perf_counter()
+
+        async def on_connection_create_end(
+            session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+        ) -> None:
+            stats["connections_new"] += 1
+            if getattr(context, "secure", False):
+                stats["tls_handshakes"] += 1
+            _record(context, "connect", getattr(context, "connect_start", None))
+
+        async def on_connection_reuseconn(
+            session: aiohttp.ClientSession, context: SimpleNamespace, params: Any
+        ) -> None:
+            stats["connections_reused"] += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_dns_resolvehost_start.append(on_dns_resolvehost_start)
+        trace_config.on_dns_resolvehost_end.append(on_dns_resolvehost_end)
+        trace_config.on_connection_create_start.append(on_connection_create_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def stats(self, entry_id: str) -> dict[str, Any]:
+        """Return connection statistics of the pool used by an entry."""
+        key = self._entries.get(entry_id)
+        if key is None or key not in self._stats:
+            return {}
+        stats = dict(self._stats[key])
+        total = stats["connections_new"] + stats["connections_reused"]
+        stats["reuse_ratio"] = round(stats["connections_reused"] / total, 3) if total else None
+        stats["entries"] = sum(1 for used in self._entries.values() if used == key)
+        return stats
+
+    async def async_release(self, entry_id: str) -> None:
+        """Stop using a pool; pools no entry uses anymore are closed."""
+        key = self._entries.pop(entry_id, None)
+        if key is None or key in self._entries.values():
+            return
+        self._stats.pop(key, None)
+        session = self._sessions.pop(key, None)
+        if session is not None:
+            await session.close()
+
+    async def async_close(self) -> None:
+        """Close every pool."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        self._stats.clear()
+        self._entries.clear()
+        for session in sessions:
+            await session.close()
+
+
+class RequestCoalescer:
+    """Deduplicate identical requests across entries.
+
+    While a request is in flight, identical requests wait for its response
+    instead of sending their own. Completed responses can also be reused for
+    a short time. Only the raw response is shared; every entry still parses
+    it into its own document.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._in_flight: dict[str, asyncio.Future] = {}
+        # Fingerprint -> (expiry time, response)
+        self._cache: dict[str, tuple[float, Any]] = {}
+
+    @staticmethod
+    def fingerprint(request: dict[str, Any], *extra: Any) -> str:
+        """Return a key identifying a request, independent of formatting details."""
+        url = urlsplit(request["url"])
+        headers = {
+            str(name).lower(): str(value)
+            for name, value in (request.get("headers") or {}).items()
+        }
+        return json.dumps(
+            [
+                request["method"].upper(),
+                url.scheme.lower(),
+                url.netloc.lower(),
+                url.path or "/",
+                url.query,
+                headers,
+                request.get("params"),
+                request.get("data"),
+                request.get("json"),
+                extra,
+            ],
+            sort_keys=True,
+            default=str,
+        )
+
+    async def async_request(
+        self,
+        key: str,
+        ttl: float,
+        fetch: Callable[[], Awaitable[Any]],
+    ) -> tuple[Any, str]:
+        """Return the response for a request and where it came from.
+
+        The source is "cache", "coalesced" (shared an in-flight request) or
+        "network" (this call sent the request).
+        """
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1], "cache"
+        
+        future = self._in_flight.get(key)
+        if future is not None:
+            return await asyncio.shield(future), "coalesced"
+        
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            response = await fetch()
+        except asyncio.CancelledError:
+            future.set_exception(UpdateFailed("Shared request was cancelled"))
+            future.exception()
+            raise
+        except Exception as err:
+            future.set_exception(err)
+            # Waiters re-raise it; do not report it as never retrieved
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            if ttl > 0:
+                self._cache = {k: v for k, v in self._cache.items() if v[0] > now}
+                self._cache[key] = (time.monotonic() + ttl, response)
+            return response, "network"
+        finally:
+            del self._in_flight[key]
+
+
+@callback
+def _async_get_domain_data(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the objects shared by all entries, creating them on first use."""
+    if DOMAIN_DATA not in hass.data:
+        pools = ConnectionPools()
+        hass.data[DOMAIN_DATA] = {
+            "scheduler": RequestScheduler(),
+            "pools": pools,
+            "coalescer": RequestCoalescer(),
+        }
+
+        async def _async_close_pools(event: Event) -> None:
+            await pools.async_close()
+
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, _async_close_pools)
+    return hass.data[DOMAIN_DATA]
+
+
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the HTTP Request component."""
     hass.data.setdefault(DOMAIN, {})
+    _async_get_domain_data(hass)
     return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up HTTP Request from a config entry."""
     hass.data.setdefault(DOMAIN, {})
+    # Objects shared by all entries
+    _async_get_domain_data(hass)
+    
+    # Load the first data before the platforms; a failure raises ConfigEntryNotReady
+    # so Home Assistant retries the whole entry
+    coordinator = HttpRequestDataUpdateCoordinator(hass, entry)
+    try:
+        if coordinator.persistent_cache and await coordinator.async_restore_cache():
+            # Stale-while-revalidate: serve the cached responses, refresh in the background
+            entry.async_create_background_task(
+                hass, coordinator.async_refresh(), f"{DOMAIN}_{entry.entry_id}_revalidate"
+            )
+        else:
+            await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        # The entry is not loaded, so async_unload_entry will not clean up
+        hass.data[DOMAIN_DATA]["scheduler"].unregister(entry.entry_id)
+        await hass.data[DOMAIN_DATA]["pools"].async_release(entry.entry_id)
+        raise
     
     # Initialize entry data structure
     hass.data[DOMAIN][entry.entry_id] = {
         "entry": entry,
         "sensors": {},
-        "coordinator": None,
+        "coordinator": coordinator,
     }
     
     # 서비스 타입으로 디바이스 등록
@@ -62,10 +466,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     
     if unload_ok:
         hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DOMAIN_DATA]["scheduler"].unregister(entry.entry_id)
+        await hass.data[DOMAIN_DATA]["pools"].async_release(entry.entry_id)
     
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persistent response cache of a deleted entry."""
+    await Store(hass, CACHE_STORAGE_VERSION, f"{DOMAIN}.cache.{entry.entry_id}").async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
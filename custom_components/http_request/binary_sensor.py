@@ -16,7 +16,10 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN, MANUFACTURER, MODEL
-from .sensor import HttpRequestDataUpdateCoordinator
+from .sensor import (
+    HttpRequestDataUpdateCoordinator,
+    apply_attribute_budget,
+)
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -27,18 +30,10 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the HTTP Request info binary sensor."""
-    # Check if coordinator already exists
-    if hass.data[DOMAIN][config_entry.entry_id]["coordinator"] is not None:
-        coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    else:
-        # Create new coordinator if not exists
-        coordinator = HttpRequestDataUpdateCoordinator(hass, config_entry)
-        hass.data[DOMAIN][config_entry.entry_id]["coordinator"] = coordinator
-        # Do initial refresh
-        await coordinator.async_config_entry_first_refresh()
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     
     # Add the info entity
-    async_add_entities([HttpRequestInfoEntity(coordinator, config_entry)], True)
+    async_add_entities([HttpRequestInfoEntity(coordinator, config_entry)])
 
 
 class HttpRequestInfoEntity(CoordinatorEntity, BinarySensorEntity):
@@ -46,6 +41,31 @@ class HttpRequestInfoEntity(CoordinatorEntity, BinarySensorEntity):
 
     _attr_has_entity_name = True
     _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    # Headers and per-refresh metrics change on every write; keep them out of the recorder
+    _unrecorded_attributes = frozenset(
+        {
+            "response_headers",
+            "stage_timings",
+            "scheduler",
+            "connection_pool",
+            "batch_status",
+            "truncated_attributes",
+            "last_scan_time",
+            "scan_interval",
+            "change_rate",
+            "content_length",
+            "parse_count",
+            "parse_mode",
+            "response_source",
+            "coalesced_count",
+            "cache_hit_count",
+            "not_modified",
+            "not_modified_count",
+            "bytes_saved",
+            "unchanged",
+            "unchanged_count",
+        }
+    )
 
     def __init__(
         self,
@@ -74,7 +94,7 @@ class HttpRequestInfoEntity(CoordinatorEntity, BinarySensorEntity):
         if self.coordinator.data is None:
             return None
         
-        status = self.coordinator.data.get("status")
+        status = self.coordinator.data.status
         if status is None:
             return None
             
@@ -84,13 +104,21 @@ class HttpRequestInfoEntity(CoordinatorEntity, BinarySensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return the state attributes."""
+        # Circuit breaker state is shown even before the first successful response
+        breaker = self.coordinator.breaker
+        circuit = {
+            "circuit_state": breaker.state,
+            "circuit_next_retry": breaker.next_retry.isoformat() if breaker.next_retry else None,
+            "consecutive_failures": breaker.failures,
+        }
+        
         if self.coordinator.data is None:
-            return None
+            return circuit
             
         response_data = self.coordinator.data
         
         attributes = {
-            "http_status": response_data.get("status"),
+            "http_status": response_data.status,
             "response_type": self.coordinator.response_type,
             "url": self.coordinator.url,
             "method": self.coordinator.method,
@@ -100,23 +128,75 @@ class HttpRequestInfoEntity(CoordinatorEntity, BinarySensorEntity):
             "last_scan_time": self.coordinator.last_update_success_time if self.coordinator.last_update_success else None,
         }
         
-        # Add response headers if available
-        if "headers" in response_data:
-            attributes["response_headers"] = dict(response_data["headers"])
+        # Adaptive polling: configured interval and observed change rate
+        if self.coordinator.adaptive_interval:
+            attributes["configured_scan_interval"] = self.coordinator.scan_interval
+            attributes["change_rate"] = self.coordinator.change_rate
+        
+        attributes.update(circuit)
+        
+        # Add allowlisted response headers
+        attributes["response_headers"] = self.coordinator.filter_headers(response_data.headers)
         
         # Add content type if available
-        if "content_type" in response_data:
-            attributes["content_type"] = response_data["content_type"]
+        if response_data.content_type:
+            attributes["content_type"] = response_data.content_type
         
         # Add response size (actual calculated size)
-        if "content_length" in response_data:
-            content_length = response_data["content_length"]
-            if content_length is not None and content_length > 0:
-                attributes["content_length"] = content_length
-            else:
-                attributes["content_length"] = "알수없음"
-        
-        return attributes
+        content_length = response_data.content_length
+        if content_length is not None and content_length > 0:
+            attributes["content_length"] = content_length
+        else:
+            attributes["content_length"] = "알수없음"
+
+        # Number of full-body parses done for this refresh (shared by all sensors)
+        attributes["parse_count"] = response_data.parse_count
+
+        # Per-stage timings (ms) and whether parsing ran on the event loop
+        if self.coordinator.timings:
+            attributes["stage_timings"] = dict(self.coordinator.timings)
+        if self.coordinator.parse_mode:
+            attributes["parse_mode"] = self.coordinator.parse_mode
+
+        # Queue depth and wait times of the shared scheduler for this host
+        scheduler_stats = self.coordinator.scheduler.host_stats(self.coordinator.url)
+        if scheduler_stats:
+            attributes["scheduler"] = scheduler_stats
+
+        # Connection reuse of the dedicated pool
+        if self.coordinator.connection_pool:
+            pool_stats = self.coordinator.pools.stats(self._config_entry.entry_id)
+            if pool_stats:
+                attributes["connection_pool"] = pool_stats
+
+        # Where the response came from and how often it was shared with other entries
+        if self.coordinator.coalesce_requests:
+            attributes["response_source"] = response_data.source
+            attributes["coalesced_count"] = self.coordinator.coalesced_count
+            attributes["cache_hit_count"] = self.coordinator.cache_hit_count
+
+        # HTTP status of each batch request (None if it failed)
+        if response_data.requests is not None:
+            attributes["batch_status"] = {
+                key: result.status if result else None
+                for key, result in response_data.requests.items()
+            }
+
+        # Conditional request (304 Not Modified) statistics
+        if self.coordinator.conditional_requests:
+            attributes["not_modified"] = response_data.not_modified
+            attributes["not_modified_count"] = self.coordinator.not_modified_count
+            attributes["bytes_saved"] = self.coordinator.bytes_saved
+
+        # Content hash change detection: refreshes whose body did not change
+        if self.coordinator.skip_unchanged:
+            attributes["unchanged"] = response_data.unchanged
+            attributes["unchanged_count"] = self.coordinator.unchanged_count
+
+        # Keep the attributes within the entity's size budget
+        return apply_attribute_budget(
+            attributes, self.coordinator.attribute_budget, ("http_status", "url")
+        )
 
     @property
     def icon(self) -> str:
@@ -124,7 +204,7 @@ class HttpRequestInfoEntity(CoordinatorEntity, BinarySensorEntity):
         if self.coordinator.data is None:
             return "mdi:cloud-question"
             
-        status = self.coordinator.data.get("status")
+        status = self.coordinator.data.status
         if status is None:
             return "mdi:cloud-question"
         
@@ -41,9 +41,71 @@ from .const import (
     CONF_ATTRIBUTES_TEMPLATE,
     CONF_KEEP_LAST_VALUE,
     CONF_RESET_SETTINGS,
+    CONF_PARSE_THRESHOLD,
+    CONF_HTML_PARSER,
+    CONF_CONDITIONAL_REQUESTS,
+    CONF_SKIP_UNCHANGED,
+    CONF_MAX_RESPONSE_SIZE,
+    CONF_JSON_STREAMING,
+    CONF_BATCH_REQUESTS,
+    CONF_BATCH_CONCURRENCY,
+    CONF_REQUEST_KEY,
+    CONF_HOST_CONCURRENCY,
+    CONF_HOST_RATE_LIMIT,
+    CONF_REQUEST_JITTER,
+    CONF_CONNECTION_POOL,
+    CONF_POOL_LIMIT_PER_HOST,
+    CONF_DNS_CACHE_TTL,
+    CONF_KEEPALIVE_TIMEOUT,
+    CONF_COALESCE_REQUESTS,
+    CONF_RESPONSE_CACHE_TTL,
+    CONF_PERSISTENT_CACHE,
+    CONF_ADAPTIVE_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_FAILURE_THRESHOLD,
+    CONF_MAX_BACKOFF,
+    CONF_WRITE_CHANGES_ONLY,
+    CONF_SENSOR_UPDATE_ATTRIBUTE,
+    CONF_ATTRIBUTE_BUDGET,
+    CONF_HEADER_ALLOWLIST,
+    CONF_TEXT_MATCH_LIMIT,
+    CONF_REGEX_TIMEOUT,
+    CONF_TIMING_SENSORS,
+    CONF_COMPACT_RETENTION,
     DEFAULT_HTML_ATTR,
+    DEFAULT_CONDITIONAL_REQUESTS,
+    DEFAULT_SKIP_UNCHANGED,
+    DEFAULT_MAX_RESPONSE_SIZE,
+    DEFAULT_JSON_STREAMING,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_HOST_CONCURRENCY,
+    DEFAULT_HOST_RATE_LIMIT,
+    DEFAULT_REQUEST_JITTER,
+    DEFAULT_CONNECTION_POOL,
+    DEFAULT_POOL_LIMIT_PER_HOST,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_COALESCE_REQUESTS,
+    DEFAULT_RESPONSE_CACHE_TTL,
+    DEFAULT_PERSISTENT_CACHE,
+    DEFAULT_ADAPTIVE_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_MAX_BACKOFF,
+    DEFAULT_WRITE_CHANGES_ONLY,
+    DEFAULT_SENSOR_UPDATE_ATTRIBUTE,
+    DEFAULT_ATTRIBUTE_BUDGET,
+    DEFAULT_HEADER_ALLOWLIST,
+    DEFAULT_TEXT_MATCH_LIMIT,
+    DEFAULT_REGEX_TIMEOUT,
+    DEFAULT_TIMING_SENSORS,
+    DEFAULT_COMPACT_RETENTION,
+    DEFAULT_HTML_PARSER,
     DEFAULT_METHOD,
     DEFAULT_NAME,
+    DEFAULT_PARSE_THRESHOLD,
     DEFAULT_RESPONSE_TYPE,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SENSOR_NAME,
@@ -55,7 +117,9 @@ from .const import (
     HTTP_METHODS,
     RESPONSE_TYPES,
     HTML_VALUE_TYPES,
+    HTML_PARSERS,
 )
+from .parser import compile_json_path, compile_regex, parse_batch_requests
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -190,7 +254,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
         """Manage the options."""
         return self.async_show_menu(
             step_id="init",
-            menu_options=["settings", "add_sensor", "edit_sensor", "remove_sensor"],
+            menu_options=["settings", "advanced", "add_sensor", "edit_sensor", "remove_sensor"],
         )
 
     async def async_step_settings(
@@ -262,6 +326,122 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             errors=errors,
         )
 
+    async def async_step_advanced(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Handle the advanced (performance) settings option."""
+        errors: dict[str, str] = {}
+
+        if user_input is not None:
+            # Validate batch requests JSON
+            try:
+                parse_batch_requests(user_input.get(CONF_BATCH_REQUESTS))
+            except ValueError:
+                errors["base"] = "invalid_batch_json"
+
+            if not errors:
+                # Update config entry
+                new_data = dict(self.config_entry.data)
+                new_data.update(user_input)
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry, data=new_data
+                )
+
+                return self.async_create_entry(title="", data={})
+
+        data = self.config_entry.data
+        data_schema = vol.Schema(
+            {
+                vol.Optional(CONF_MAX_RESPONSE_SIZE, default=data.get(CONF_MAX_RESPONSE_SIZE, DEFAULT_MAX_RESPONSE_SIZE)): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=1048576)
+                ),
+                vol.Optional(CONF_PARSE_THRESHOLD, default=data.get(CONF_PARSE_THRESHOLD, DEFAULT_PARSE_THRESHOLD)): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=102400)
+                ),
+                vol.Optional(CONF_JSON_STREAMING, default=data.get(CONF_JSON_STREAMING, DEFAULT_JSON_STREAMING)): bool,
+                vol.Optional(CONF_HTML_PARSER, default=data.get(CONF_HTML_PARSER, DEFAULT_HTML_PARSER)): vol.In(HTML_PARSERS),
+                vol.Optional(CONF_CONDITIONAL_REQUESTS, default=data.get(CONF_CONDITIONAL_REQUESTS, DEFAULT_CONDITIONAL_REQUESTS)): bool,
+                vol.Optional(CONF_SKIP_UNCHANGED, default=data.get(CONF_SKIP_UNCHANGED, DEFAULT_SKIP_UNCHANGED)): bool,
+                vol.Optional(CONF_BATCH_REQUESTS, default=data.get(CONF_BATCH_REQUESTS, "")): TextSelector(
+                    TextSelectorConfig(type=TextSelectorType.TEXT, multiline=True)
+                ),
+                vol.Optional(CONF_BATCH_CONCURRENCY, default=data.get(CONF_BATCH_CONCURRENCY, DEFAULT_BATCH_CONCURRENCY)): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=32)
+                ),
+                vol.Optional(CONF_HOST_CONCURRENCY, default=data.get(CONF_HOST_CONCURRENCY, DEFAULT_HOST_CONCURRENCY)): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=64)
+                ),
+                vol.Optional(CONF_HOST_RATE_LIMIT, default=data.get(CONF_HOST_RATE_LIMIT, DEFAULT_HOST_RATE_LIMIT)): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=100)
+                ),
+                vol.Optional(CONF_REQUEST_JITTER, default=data.get(CONF_REQUEST_JITTER, DEFAULT_REQUEST_JITTER)): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=60)
+                ),
+                vol.Optional(CONF_ADAPTIVE_INTERVAL, default=data.get(CONF_ADAPTIVE_INTERVAL, DEFAULT_ADAPTIVE_INTERVAL)): bool,
+                vol.Optional(CONF_MIN_SCAN_INTERVAL, default=data.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)): vol.All(
+                    vol.Coerce(int), vol.Range(min=5, max=86400)
+                ),
+                vol.Optional(CONF_MAX_SCAN_INTERVAL, default=data.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL)): vol.All(
+                    vol.Coerce(int), vol.Range(min=5, max=86400)
+                ),
+                vol.Optional(CONF_WRITE_CHANGES_ONLY, default=data.get(CONF_WRITE_CHANGES_ONLY, DEFAULT_WRITE_CHANGES_ONLY)): bool,
+                vol.Optional(CONF_SENSOR_UPDATE_ATTRIBUTE, default=data.get(CONF_SENSOR_UPDATE_ATTRIBUTE, DEFAULT_SENSOR_UPDATE_ATTRIBUTE)): bool,
+                vol.Optional(CONF_ATTRIBUTE_BUDGET, default=data.get(CONF_ATTRIBUTE_BUDGET, DEFAULT_ATTRIBUTE_BUDGET)): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=65536)
+                ),
+                vol.Optional(CONF_HEADER_ALLOWLIST, default=data.get(CONF_HEADER_ALLOWLIST, DEFAULT_HEADER_ALLOWLIST)): str,
+                vol.Optional(CONF_TEXT_MATCH_LIMIT, default=data.get(CONF_TEXT_MATCH_LIMIT, DEFAULT_TEXT_MATCH_LIMIT)): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=1000000)
+                ),
+                vol.Optional(CONF_REGEX_TIMEOUT, default=data.get(CONF_REGEX_TIMEOUT, DEFAULT_REGEX_TIMEOUT)): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=60)
+                ),
+                vol.Optional(CONF_TIMING_SENSORS, default=data.get(CONF_TIMING_SENSORS, DEFAULT_TIMING_SENSORS)): bool,
+                vol.Optional(CONF_COMPACT_RETENTION, default=data.get(CONF_COMPACT_RETENTION, DEFAULT_COMPACT_RETENTION)): bool,
+                vol.Optional(CONF_FAILURE_THRESHOLD, default=data.get(CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD)): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=100)
+                ),
+                vol.Optional(CONF_MAX_BACKOFF, default=data.get(CONF_MAX_BACKOFF, DEFAULT_MAX_BACKOFF)): vol.All(
+                    vol.Coerce(int), vol.Range(min=60, max=86400)
+                ),
+                vol.Optional(CONF_PERSISTENT_CACHE, default=data.get(CONF_PERSISTENT_CACHE, DEFAULT_PERSISTENT_CACHE)): bool,
+                vol.Optional(CONF_COALESCE_REQUESTS, default=data.get(CONF_COALESCE_REQUESTS, DEFAULT_COALESCE_REQUESTS)): bool,
+                vol.Optional(CONF_RESPONSE_CACHE_TTL, default=data.get(CONF_RESPONSE_CACHE_TTL, DEFAULT_RESPONSE_CACHE_TTL)): vol.All(
+                    vol.Coerce(float), vol.Range(min=0, max=3600)
+                ),
+                vol.Optional(CONF_CONNECTION_POOL, default=data.get(CONF_CONNECTION_POOL, DEFAULT_CONNECTION_POOL)): bool,
+                vol.Optional(CONF_POOL_LIMIT_PER_HOST, default=data.get(CONF_POOL_LIMIT_PER_HOST, DEFAULT_POOL_LIMIT_PER_HOST)): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=256)
+                ),
+                vol.Optional(CONF_DNS_CACHE_TTL, default=data.get(CONF_DNS_CACHE_TTL, DEFAULT_DNS_CACHE_TTL)): vol.All(
+                    vol.Coerce(int), vol.Range(min=0, max=86400)
+                ),
+                vol.Optional(CONF_KEEPALIVE_TIMEOUT, default=data.get(CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT)): vol.All(
+                    vol.Coerce(int), vol.Range(min=1, max=3600)
+                ),
+            }
+        )
+
+        return self.async_show_form(
+            step_id="advanced",
+            data_schema=data_schema,
+            errors=errors,
+        )
+
+    def _request_key_schema(self, default: str = "") -> dict[Any, Any]:
+        """Return the request selector field for entries with batch requests."""
+        try:
+            batch_requests = parse_batch_requests(self.config_entry.data.get(CONF_BATCH_REQUESTS))
+        except ValueError:
+            batch_requests = {}
+        if not batch_requests:
+            return {}
+        options = {"": self.config_entry.data.get(CONF_URL, "")}
+        options.update({key: key for key in batch_requests})
+        if default not in options:
+            default = ""
+        return {vol.Optional(CONF_REQUEST_KEY, default=default): vol.In(options)}
+
     async def async_step_add_sensor(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -296,6 +476,20 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 except json.JSONDecodeError:
                     errors["base"] = "invalid_attributes_json"
             
+            # Validate JSON path syntax if provided
+            if user_input.get(CONF_JSON_PATH):
+                try:
+                    compile_json_path(user_input[CONF_JSON_PATH])
+                except ValueError:
+                    errors["base"] = "invalid_json_path"
+            
+            # Validate regex syntax if provided
+            if user_input.get(CONF_TEXT_REGEX):
+                try:
+                    compile_regex(user_input[CONF_TEXT_REGEX])
+                except ValueError:
+                    errors["base"] = "invalid_regex"
+            
             if not errors:
                 # Add new sensor to the sensors list
                 new_data = dict(self.config_entry.data)
@@ -386,6 +580,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 }
             )
 
+        # Let sensors of a batch entry pick the request they read from
+        data_schema = data_schema.extend(self._request_key_schema())
+
         # Set description based on response type
         response_type = self.config_entry.data.get(CONF_RESPONSE_TYPE, DEFAULT_RESPONSE_TYPE)
         description_placeholders = {
@@ -445,6 +642,20 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 except json.JSONDecodeError:
                     errors["base"] = "invalid_attributes_json"
             
+            # Validate JSON path syntax if provided
+            if user_input.get(CONF_JSON_PATH):
+                try:
+                    compile_json_path(user_input[CONF_JSON_PATH])
+                except ValueError:
+                    errors["base"] = "invalid_json_path"
+            
+            # Validate regex syntax if provided
+            if user_input.get(CONF_TEXT_REGEX):
+                try:
+                    compile_regex(user_input[CONF_TEXT_REGEX])
+                except ValueError:
+                    errors["base"] = "invalid_regex"
+            
             if not errors:
                 # Update sensor configuration
                 new_data = dict(self.config_entry.data)
@@ -479,6 +690,9 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     # Keep last value setting if checked
                     if user_input.get(CONF_KEEP_LAST_VALUE):
                         updated_sensor[CONF_KEEP_LAST_VALUE] = True
+                    # Keep the request the sensor reads from
+                    if user_input.get(CONF_REQUEST_KEY):
+                        updated_sensor[CONF_REQUEST_KEY] = user_input[CONF_REQUEST_KEY]
                 else:
                     # Normal update - add only non-empty fields
                     for key, value in user_input.items():
@@ -563,6 +777,7 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 vol.Optional(CONF_RESET_SETTINGS, default=False): bool,
             })
         
+        schema_dict.update(self._request_key_schema(self.sensor_to_edit.get(CONF_REQUEST_KEY, "")))
         data_schema = vol.Schema(schema_dict)
 
         # Set description based on response type
@@ -55,5 +55,76 @@ HTML_VALUE_TYPES: Final = ["value", "attribute", "html", "outerhtml"]
 # Attributes template
 CONF_ATTRIBUTES_TEMPLATE: Final = "attributes_template"
 
+# Advanced (performance) settings
+CONF_PARSE_THRESHOLD: Final = "parse_threshold"
+DEFAULT_PARSE_THRESHOLD: Final = 256  # KB, larger payloads are parsed off the event loop
+CONF_HTML_PARSER: Final = "html_parser"
+DEFAULT_HTML_PARSER: Final = "html.parser"
+HTML_PARSERS: Final = ["html.parser", "lxml"]
+CONF_CONDITIONAL_REQUESTS: Final = "conditional_requests"
+DEFAULT_CONDITIONAL_REQUESTS: Final = False
+CONF_SKIP_UNCHANGED: Final = "skip_unchanged"
+DEFAULT_SKIP_UNCHANGED: Final = False
+CONF_MAX_RESPONSE_SIZE: Final = "max_response_size"
+DEFAULT_MAX_RESPONSE_SIZE: Final = 10240  # KB
+READ_CHUNK_SIZE: Final = 65536  # bytes
+CONF_JSON_STREAMING: Final = "json_streaming"
+DEFAULT_JSON_STREAMING: Final = False
+CONF_BATCH_REQUESTS: Final = "batch_requests"
+CONF_BATCH_CONCURRENCY: Final = "batch_concurrency"
+DEFAULT_BATCH_CONCURRENCY: Final = 4
+CONF_REQUEST_KEY: Final = "request_key"
+CONF_HOST_CONCURRENCY: Final = "host_concurrency"
+DEFAULT_HOST_CONCURRENCY: Final = 4  # simultaneous requests per host, 0 = unlimited
+CONF_HOST_RATE_LIMIT: Final = "host_rate_limit"
+DEFAULT_HOST_RATE_LIMIT: Final = 0.0  # requests per second per host, 0 = unlimited
+CONF_REQUEST_JITTER: Final = "request_jitter"
+DEFAULT_REQUEST_JITTER: Final = 1.0  # seconds of random delay before scheduled refreshes
+CONF_CONNECTION_POOL: Final = "connection_pool"
+DEFAULT_CONNECTION_POOL: Final = False
+CONF_POOL_LIMIT_PER_HOST: Final = "pool_limit_per_host"
+DEFAULT_POOL_LIMIT_PER_HOST: Final = 8  # open connections per host, 0 = unlimited
+CONF_DNS_CACHE_TTL: Final = "dns_cache_ttl"
+DEFAULT_DNS_CACHE_TTL: Final = 300  # seconds
+CONF_KEEPALIVE_TIMEOUT: Final = "keepalive_timeout"
+DEFAULT_KEEPALIVE_TIMEOUT: Final = 30  # seconds an idle connection is kept open
+CONF_COALESCE_REQUESTS: Final = "coalesce_requests"
+DEFAULT_COALESCE_REQUESTS: Final = True
+CONF_RESPONSE_CACHE_TTL: Final = "response_cache_ttl"
+DEFAULT_RESPONSE_CACHE_TTL: Final = 0  # seconds identical requests reuse a response, 0 = off
+CONF_PERSISTENT_CACHE: Final = "persistent_cache"
+DEFAULT_PERSISTENT_CACHE: Final = False
+CACHE_STORAGE_VERSION: Final = 1
+CACHE_SAVE_DELAY: Final = 30  # seconds, batches disk writes of the persistent cache
+CONF_ADAPTIVE_INTERVAL: Final = "adaptive_interval"
+DEFAULT_ADAPTIVE_INTERVAL: Final = False
+CONF_MIN_SCAN_INTERVAL: Final = "min_scan_interval"
+DEFAULT_MIN_SCAN_INTERVAL: Final = 30  # seconds
+CONF_MAX_SCAN_INTERVAL: Final = "max_scan_interval"
+DEFAULT_MAX_SCAN_INTERVAL: Final = 3600  # seconds
+CONF_FAILURE_THRESHOLD: Final = "failure_threshold"
+DEFAULT_FAILURE_THRESHOLD: Final = 3  # consecutive failures that open the circuit, 0 = never
+CONF_MAX_BACKOFF: Final = "max_backoff"
+DEFAULT_MAX_BACKOFF: Final = 3600  # seconds
+BREAKER_BASE_BACKOFF: Final = 60  # seconds, doubled each time the circuit opens again
+CONF_WRITE_CHANGES_ONLY: Final = "write_changes_only"
+DEFAULT_WRITE_CHANGES_ONLY: Final = True
+CONF_SENSOR_UPDATE_ATTRIBUTE: Final = "sensor_update_attribute"
+DEFAULT_SENSOR_UPDATE_ATTRIBUTE: Final = False
+CONF_ATTRIBUTE_BUDGET: Final = "attribute_budget"
+DEFAULT_ATTRIBUTE_BUDGET: Final = 0  # bytes of JSON per entity, 0 = unlimited
+CONF_HEADER_ALLOWLIST: Final = "header_allowlist"
+DEFAULT_HEADER_ALLOWLIST: Final = "*"
+CONF_TEXT_MATCH_LIMIT: Final = "text_match_limit"
+DEFAULT_TEXT_MATCH_LIMIT: Final = 10000  # matches kept per regex for templates
+CONF_REGEX_TIMEOUT: Final = "regex_timeout"
+DEFAULT_REGEX_TIMEOUT: Final = 1.0  # seconds, enforced by the 'regex' package, 0 = none
+CONF_TIMING_SENSORS: Final = "timing_sensors"
+DEFAULT_TIMING_SENSORS: Final = False
+TIMING_WINDOW: Final = 100  # refreshes kept for timing percentiles
+TIMING_STAGES: Final = ["fetch", "ttfb", "download", "parse", "render"]
+CONF_COMPACT_RETENTION: Final = "compact_retention"
+DEFAULT_COMPACT_RETENTION: Final = False
+
 # Reset settings
 CONF_RESET_SETTINGS: Final = "reset_settings"
\ No newline at end of file
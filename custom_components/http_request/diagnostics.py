@@ -0,0 +1,119 @@
+"""Diagnostics support for HTTP Request."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+import dataclasses
+import sys
+from typing import Any
+from urllib.parse import urlsplit
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_BATCH_REQUESTS, CONF_BODY, CONF_HEADERS, CONF_PARAMS, CONF_URL, DOMAIN
+
+# Request options that may carry credentials
+TO_REDACT = {CONF_HEADERS, CONF_PARAMS, CONF_BODY, CONF_BATCH_REQUESTS}
+
+
+def _redact_url(url: str) -> str:
+    """Return the URL with its credentials and query redacted (they often hold API keys)."""
+    parts = urlsplit(url)
+    netloc = parts.netloc
+    if "@" in netloc:
+        netloc = f"{REDACTED}@{netloc.rsplit('@', 1)[1]}"
+    return parts._replace(
+        netloc=netloc, query=REDACTED if parts.query else "", fragment=""
+    ).geturl()
+
+
+def _approximate_size(obj: Any) -> int:
+    """Return the approximate memory (bytes) held by an object and what it references."""
+    size = 0
+    seen: set[int] = set()
+    stack = [obj]
+    while stack:
+        item = stack.pop()
+        if id(item) in seen:
+            continue
+        seen.add(id(item))
+        size += sys.getsizeof(item)
+        if isinstance(item, (str, bytes, int, float, bool)) or item is None:
+            continue
+        if isinstance(item, Mapping):
+            for key, value in item.items():
+                stack.extend((key, value))
+        elif isinstance(item, (list, tuple, set, frozenset)):
+            stack.extend(item)
+        elif dataclasses.is_dataclass(item):
+            stack.extend(getattr(item, f.name) for f in dataclasses.fields(item))
+    return size
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    diagnostics: dict[str, Any] = {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+    }
+    if url := entry.data.get(CONF_URL):
+        diagnostics["entry"][CONF_URL] = _redact_url(url)
+    
+    coordinator = hass.data[DOMAIN].get(entry.entry_id, {}).get("coordinator")
+    if coordinator is None:
+        return diagnostics
+    
+    data = coordinator.data
+    diagnostics["coordinator"] = {
+        "last_update_success": coordinator.last_update_success,
+        "last_scan_time": coordinator.last_update_success_time,
+        "update_interval": coordinator.update_interval.total_seconds() if coordinator.update_interval else None,
+        "http_status": data.status if data else None,
+        "content_length": data.content_length if data else None,
+        "source": data.source if data else None,
+        "parse_mode": coordinator.parse_mode,
+        "parse_count": data.parse_count if data else None,
+        "not_modified_count": coordinator.not_modified_count,
+        "bytes_saved": coordinator.bytes_saved,
+        "unchanged_count": coordinator.unchanged_count,
+        "coalesced_count": coordinator.coalesced_count,
+        "cache_hit_count": coordinator.cache_hit_count,
+        "circuit": {
+            "state": coordinator.breaker.state,
+            "failures": coordinator.breaker.failures,
+            "next_retry": coordinator.breaker.next_retry,
+        },
+    }
+    # Last refresh and rolling percentiles of every stage (ms)
+    diagnostics["timings"] = {
+        "last": coordinator.timings,
+        "percentiles": coordinator.timing_stats.as_dict(),
+    }
+    # What each request extracts: sensor paths and the 'response' keys templates read
+    diagnostics["projection"] = {
+        spec.key: {
+            "json_paths": [path.path for path in spec.plan.json_paths],
+            "response_keys": [key for key, _ in spec.plan.response_paths],
+            "needs_body": spec.plan.needs_body,
+            "streaming": spec.streaming,
+        }
+        for spec in coordinator.requests
+    }
+    # Memory held by the latest result of each request (document and headers)
+    retained = {
+        spec.key: _approximate_size((result.document, result.headers))
+        for spec in coordinator.requests
+        if (result := coordinator.get_result(spec.key)) is not None
+    }
+    diagnostics["memory"] = {
+        "compact_retention": coordinator.compact_retention,
+        "retained_bytes": sum(retained.values()),
+        "requests": retained,
+    }
+    diagnostics["scheduler"] = coordinator.scheduler.host_stats(coordinator.url)
+    if coordinator.connection_pool:
+        diagnostics["connection_pool"] = coordinator.pools.stats(entry.entry_id)
+    
+    return diagnostics
@@ -4,18 +4,677 @@ from __future__ import annotations
 import json
 import logging
 import re
+from collections.abc import Iterable
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from itertools import islice
 from typing import Any
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
+import soupsieve
+
+try:
+    import lxml  # noqa: F401
+except ImportError:
+    LXML_AVAILABLE = False
+else:
+    LXML_AVAILABLE = True
+
+try:
+    # Incremental JSON parser for streaming extraction (a manifest requirement)
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # Drop-in regex engine that supports matching timeouts (a manifest requirement;
+    # the standard library is only a fallback for environments without it)
+    import regex as regex_module
+except ImportError:
+    regex_module = None
 
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import TemplateError
 from homeassistant.helpers import template as template_helper
 
+from .const import (
+    CONF_ATTRIBUTES_TEMPLATE,
+    CONF_BODY,
+    CONF_HEADERS,
+    CONF_HTML_ATTR_NAME,
+    CONF_HTML_SELECTOR,
+    CONF_HTML_VALUE_TYPE,
+    CONF_JSON_PATH,
+    CONF_METHOD,
+    CONF_PARAMS,
+    CONF_TEXT_GROUP_COUNT,
+    CONF_TEXT_REGEX,
+    CONF_URL,
+    CONF_VALUE_TEMPLATE,
+    DEFAULT_TEXT_GROUP_COUNT,
+    DEFAULT_TEXT_MATCH_LIMIT,
+    HTTP_METHODS,
+)
+
 _LOGGER = logging.getLogger(__name__)
 
 
-def parse_json(data: str | dict, path: str | None = None) -> Any:
+@dataclass(frozen=True)
+class HtmlSpec:
+    """One HTML extraction configured on a sensor."""
+
+    selector: str
+    value_type: str = "value"
+    attr_name: str | None = None
+
+
+@dataclass(frozen=True)
+class ExtractionPlan:
+    """Everything the sensors of one entry extract from a response."""
+
+    html: tuple[HtmlSpec, ...] = ()
+    html_parser: str = "html.parser"
+    json_paths: tuple[JsonPath, ...] = ()
+    # True when sensors only need their JSON paths, never the whole document
+    paths_only: bool = False
+    # Text regexes with the number of matches sensors need (the total is always counted)
+    text_regexes: tuple[tuple[str, int], ...] = ()
+    regex_timeout: float | None = None
+    # True when a sensor reads the whole body (no path/selector/regex, or all of 'response')
+    needs_body: bool = True
+    # Top-level keys templates read from 'response', with their paths (also in json_paths)
+    response_paths: tuple[tuple[str, JsonPath], ...] = ()
+
+    @classmethod
+    def from_sensors(
+        cls,
+        sensors: Iterable[dict[str, Any]],
+        html_parser: str = "html.parser",
+        match_limit: int = DEFAULT_TEXT_MATCH_LIMIT,
+        regex_timeout: float | None = None,
+    ) -> ExtractionPlan:
+        """Build the plan from the entry's sensor configurations."""
+        html: dict[HtmlSpec, None] = {}
+        json_paths: dict[str, JsonPath] = {}
+        text_regexes: dict[str, int] = {}
+        response_paths: dict[str, JsonPath] = {}
+        paths_only = True
+        needs_body = False
+        for sensor_config in sensors:
+            response_keys = template_response_keys(sensor_config)
+            if response_keys is None:
+                # The whole 'response' may be read
+                paths_only = False
+                needs_body = True
+            else:
+                # Only these keys are handed to templates (and streamed)
+                for key in sorted(response_keys):
+                    response_paths.setdefault(key, response_key_path(key))
+            if not any(
+                sensor_config.get(key)
+                for key in (CONF_JSON_PATH, CONF_HTML_SELECTOR, CONF_TEXT_REGEX)
+            ):
+                needs_body = True
+            if spec := html_spec_from_config(sensor_config):
+                html[spec] = None
+            if regex := sensor_config.get(CONF_TEXT_REGEX):
+                # Templates may use every match through 'value'; otherwise the state
+                # and attributes only need the configured group count
+                if template_uses_variable(sensor_config, "value", "value_json"):
+                    limit = match_limit
+                else:
+                    limit = min(
+                        sensor_config.get(CONF_TEXT_GROUP_COUNT, DEFAULT_TEXT_GROUP_COUNT),
+                        match_limit,
+                    )
+                text_regexes[regex] = max(limit, text_regexes.get(regex, 0))
+            if not (path := sensor_config.get(CONF_JSON_PATH)):
+                # The value is the whole body
+                paths_only = False
+                continue
+            try:
+                json_paths[path] = compile_json_path(path)
+            except ValueError:
+                continue
+        for path in response_paths.values():
+            json_paths.setdefault(path.path, path)
+        return cls(
+            html=tuple(html),
+            html_parser=html_parser,
+            json_paths=tuple(json_paths.values()),
+            paths_only=paths_only and bool(json_paths),
+            text_regexes=tuple(text_regexes.items()),
+            regex_timeout=regex_timeout or None,
+            needs_body=needs_body,
+            response_paths=tuple(response_paths.items()),
+        )
+
+    @property
+    def streamable(self) -> bool:
+        """Return True if the JSON paths can be extracted while streaming."""
+        return (
+            ijson is not None
+            and self.paths_only
+            and all(path.is_streamable for path in self.json_paths)
+        )
+
+
+def template_uses_variable(sensor_config: dict[str, Any], *names: str) -> bool:
+    """Return True if a sensor's templates may read any of these variables.
+
+    Conservative: any mention of a name counts as a use.
+    """
+    pattern = re.compile(r"\b(?:" + "|".join(map(re.escape, names)) + r")\b")
+    return any(
+        pattern.search(sensor_config.get(key) or "")
+        for key in (CONF_VALUE_TEMPLATE, CONF_ATTRIBUTES_TEMPLATE)
+    )
+
+
+# Every mention of 'response', with the constant key that directly follows it, if any
+_RESPONSE_REFERENCE = re.compile(
+    r"""\bresponse\b(?:\s*(?:\.\s*([A-Za-z_]\w*)\b|\[\s*(?:'([^'\\]*)'|"([^"\\]*)")\s*\]))?"""
+)
+# 'response.items' is the dict method, not a key
+_MAPPING_ATTRIBUTES = frozenset(name for name in dir(dict) if not name.startswith("_"))
+
+
+def template_response_keys(sensor_config: dict[str, Any]) -> set[str] | None:
+    """Return the top-level 'response' keys a sensor's templates read.
+
+    Conservative: None (the whole response) unless every mention of
+    'response' is directly followed by a constant key, as in response.main
+    or response['main'].
+    """
+    keys: set[str] = set()
+    for conf_key in (CONF_VALUE_TEMPLATE, CONF_ATTRIBUTES_TEMPLATE):
+        for match in _RESPONSE_REFERENCE.finditer(sensor_config.get(conf_key) or ""):
+            name, single, double = match.groups()
+            if name is not None and name not in _MAPPING_ATTRIBUTES:
+                keys.add(name)
+            elif single is not None or double is not None:
+                keys.add(single if single is not None else double)
+            else:
+                return None
+    return keys
+
+
+def response_key_path(key: str) -> JsonPath:
+    """Return the JSON path of a top-level 'response' key."""
+    return JsonPath(f"[{key!r}]", (("key", key),))
+
+
+def html_spec_from_config(sensor_config: dict[str, Any]) -> HtmlSpec | None:
+    """Return the HTML extraction of a sensor config, if it has a selector."""
+    selector = sensor_config.get(CONF_HTML_SELECTOR)
+    if not selector:
+        return None
+    return HtmlSpec(
+        selector=selector,
+        value_type=sensor_config.get(CONF_HTML_VALUE_TYPE, "value"),
+        attr_name=sensor_config.get(CONF_HTML_ATTR_NAME) or None,
+    )
+
+
+@dataclass(frozen=True)
+class ResponseDocument:
+    """Parsed view of a single HTTP response, shared by every sensor.
+
+    The coordinator builds one document per refresh and all sensors and
+    templates read from it, so the body is parsed once instead of once per
+    sensor. Treat the parsed JSON tree and extracted values as read-only.
+    """
+
+    text: str
+    response_type: str
+    json: Any = None
+    html_values: dict[HtmlSpec, Any] = field(default_factory=dict)
+    # Values of JSON paths extracted while streaming, keyed by path string
+    json_values: dict[str, Any] | None = None
+    # Matches of each sensor regex (text responses, up to the plan's limit) and
+    # their total count, keyed by pattern
+    text_matches: dict[str, list[Any] | None] = field(default_factory=dict)
+    text_counts: dict[str, int] = field(default_factory=dict)
+    parse_count: int = 0
+    # Projection of 'response' to the keys templates read, once the body is released
+    response_values: dict[str, Any] | None = None
+
+    def resolve_json_path(self, path: JsonPath) -> Any:
+        """Return the value of a JSON path from the streamed values or the tree."""
+        if self.json_values is not None:
+            return self.json_values.get(path.path)
+        if self.json is None:
+            return None
+        return path.resolve(self.json)
+
+    @property
+    def response(self) -> Any:
+        """Return the 'response' template variable (JSON if parseable, else text)."""
+        if self.response_values is not None:
+            return self.response_values
+        return self.json if self.json is not None else self.text
+
+    def compact(self, plan: ExtractionPlan) -> ResponseDocument:
+        """Return a copy without the body and JSON tree if no sensor reads them.
+
+        The plan's JSON paths are resolved now and kept as values, like a
+        streamed document; HTML values and regex matches are already extracted.
+        'response' keeps only the keys templates read, which needs a JSON object.
+        """
+        if plan.needs_body:
+            return self
+        if plan.response_paths and not isinstance(self.json, dict):
+            # Text or a JSON array: 'response' cannot be projected
+            return self
+        json_values = self.json_values
+        if json_values is None:
+            json_values = (
+                {path.path: path.resolve(self.json) for path in plan.json_paths}
+                if self.json is not None
+                else {}
+            )
+        response_values = None
+        if plan.response_paths:
+            response_values = {
+                key: self.json[key] for key, _ in plan.response_paths if key in self.json
+            }
+        return replace(
+            self, text="", json=None, json_values=json_values, response_values=response_values
+        )
+
+
+def build_streamed_document(
+    extractor: JsonStreamExtractor,
+    response_type: str,
+    plan: ExtractionPlan | None = None,
+) -> ResponseDocument:
+    """Return the document for a body whose JSON paths were extracted while streaming."""
+    json_values = dict(extractor.values)
+    response_values = None
+    if plan is not None and plan.response_paths:
+        # Only the keys found in the body, as a dict lookup would see them
+        response_values = {
+            key: json_values[path.path]
+            for key, path in plan.response_paths
+            if path.path in json_values
+        }
+    return ResponseDocument(
+        text="",
+        response_type=response_type,
+        json_values=json_values,
+        parse_count=1,
+        response_values=response_values,
+    )
+
+
+def build_document(
+    text: str, response_type: str, plan: ExtractionPlan | None = None
+) -> ResponseDocument:
+    """Parse a response body once and return the shared document."""
+    plan = plan or ExtractionPlan()
+    parse_count = 0
+    json_data = None
+    html_values: dict[HtmlSpec, Any] = {}
+    text_matches: dict[str, list[Any] | None] = {}
+    text_counts: dict[str, int] = {}
+
+    # Every response type exposes the body as JSON to templates when possible
+    if text:
+        parse_count += 1
+        try:
+            json_data = json.loads(text)
+        except ValueError:
+            json_data = None
+
+    if response_type == "html" and plan.html:
+        # Build the tree once and resolve every sensor's selector in one pass
+        parse_count += 1
+        soup = BeautifulSoup(text, resolve_html_parser(plan.html_parser))
+        html_values = extract_html(soup, plan.html)
+
+    if response_type == "text":
+        # Regex matching belongs to the parse stage, off the loop for large bodies
+        for regex, limit in plan.text_regexes:
+            text_matches[regex], text_counts[regex] = match_text(
+                text, regex, limit, plan.regex_timeout
+            )
+
+    return ResponseDocument(
+        text=text,
+        response_type=response_type,
+        json=json_data,
+        html_values=html_values,
+        text_matches=text_matches,
+        text_counts=text_counts,
+        parse_count=parse_count,
+    )
+
+
+def resolve_html_parser(name: str) -> str:
+    """Return the BeautifulSoup tree builder to use, falling back if lxml is missing."""
+    if name == "lxml" and not LXML_AVAILABLE:
+        _LOGGER.warning("lxml is not installed, falling back to html.parser")
+        return "html.parser"
+    return name
+
+
+def extract_html(soup: BeautifulSoup, specs: Iterable[HtmlSpec]) -> dict[HtmlSpec, Any]:
+    """Resolve many selectors with a single walk over the tree.
+
+    Each selector gets the first matching element in document order, the
+    same element `select_one` would return. The walk stops as soon as every
+    selector has been resolved.
+    """
+    results: dict[HtmlSpec, Any] = {}
+    pending: dict[str, tuple[Any, list[HtmlSpec]]] = {}
+    for spec in specs:
+        results[spec] = None
+        if spec.selector in pending:
+            pending[spec.selector][1].append(spec)
+            continue
+        try:
+            pending[spec.selector] = (soupsieve.compile(spec.selector), [spec])
+        except Exception as err:
+            _LOGGER.error("Invalid CSS selector '%s': %s", spec.selector, err)
+
+    for element in soup.descendants:
+        if not pending:
+            break
+        if not isinstance(element, Tag):
+            continue
+        for selector, (matcher, selector_specs) in list(pending.items()):
+            if matcher.match(element):
+                for spec in selector_specs:
+                    results[spec] = html_element_value(element, spec.value_type, spec.attr_name)
+                del pending[selector]
+
+    for selector in pending:
+        _LOGGER.debug("No element found for selector: %s", selector)
+
+    return results
+
+
+def html_element_value(element: Tag, value_type: str = "value", attr_name: str | None = None) -> Any:
+    """Return the value of an element for the configured value type."""
+    if value_type == "value":
+        # Return text content without HTML tags
+        return element.get_text(strip=True)
+    elif value_type == "attribute":
+        # Return specific attribute value
+        if attr_name:
+            return element.get(attr_name)
+        else:
+            _LOGGER.error("Attribute name not specified for attribute type")
+            return None
+    elif value_type == "html":
+        # Return inner HTML
+        return ''.join(str(child) for child in element.children)
+    elif value_type == "outerhtml":
+        # Return outer HTML (including the element itself)
+        return str(element)
+    else:
+        # Default to text
+        return element.get_text(strip=True)
+
+
+_MISSING = object()
+
+
+class JsonPath:
+    """A JSON path compiled once into a list of access steps.
+
+    Supported syntax:
+    - Simple path: "data.temperature"
+    - Array index: "items[0].value", "items[-1]"
+    - Bracket notation: "data['temperature']", 'data["temperature"]'
+    - Wildcard: "items[*].value" (list or dict values)
+    - Slice: "items[0:5]", "items[::2].value"
+
+    Paths with a wildcard or slice return a list of the matching values.
+    """
+
+    __slots__ = ("path", "steps", "is_multi", "is_streamable")
+
+    def __init__(self, path: str, steps: tuple[tuple[Any, ...], ...]) -> None:
+        """Initialize the compiled path."""
+        self.path = path
+        self.steps = steps
+        self.is_multi = any(step[0] in ("wildcard", "slice") for step in steps)
+        # Streaming needs one concrete location: keys and non-negative indices
+        self.is_streamable = all(
+            step[0] == "key" or (step[0] == "index" and step[1] >= 0)
+            for step in steps
+        )
+
+    def __repr__(self) -> str:
+        """Return the representation."""
+        return f"JsonPath({self.path!r})"
+
+    def resolve(self, data: Any) -> Any:
+        """Return the value at this path, or None if it does not exist."""
+        result = self._resolve(data, 0)
+        return None if result is _MISSING else result
+
+    def _resolve(self, data: Any, start: int) -> Any:
+        """Walk the steps from index start, fanning out on wildcards and slices."""
+        for pos in range(start, len(self.steps)):
+            kind, *args = self.steps[pos]
+            if kind in ("wildcard", "slice"):
+                if kind == "wildcard":
+                    if isinstance(data, dict):
+                        items = data.values()
+                    elif isinstance(data, list):
+                        items = data
+                    else:
+                        return _MISSING
+                else:
+                    if not isinstance(data, list):
+                        return _MISSING
+                    items = data[slice(*args)]
+                results = []
+                for item in items:
+                    value = self._resolve(item, pos + 1)
+                    if value is not _MISSING:
+                        results.append(value)
+                return results
+            try:
+                data = data[args[0]]
+            except (KeyError, IndexError, TypeError):
+                return _MISSING
+        return data
+
+
+def _parse_index(path: str, token: str) -> tuple[Any, ...]:
+    """Compile the contents of one [...] segment."""
+    token = token.strip()
+    if not token:
+        raise ValueError(f"Empty brackets in JSON path '{path}'")
+    if token == "*":
+        return ("wildcard",)
+    if len(token) >= 2 and token[0] == token[-1] and token[0] in "'\"":
+        return ("key", token[1:-1])
+    if ":" in token:
+        parts = token.split(":")
+        if len(parts) > 3:
+            raise ValueError(f"Invalid slice '[{token}]' in JSON path '{path}'")
+        try:
+            bounds = [int(part) if part.strip() else None for part in parts]
+        except ValueError as err:
+            raise ValueError(f"Invalid slice '[{token}]' in JSON path '{path}'") from err
+        if len(bounds) == 3 and bounds[2] == 0:
+            raise ValueError(f"Slice step cannot be zero in JSON path '{path}'")
+        return ("slice", *bounds)
+    try:
+        return ("index", int(token))
+    except ValueError as err:
+        raise ValueError(f"Invalid index '[{token}]' in JSON path '{path}'") from err
+
+
+@lru_cache(maxsize=512)
+def compile_json_path(path: str) -> JsonPath:
+    """Compile a JSON path, raising ValueError if it is malformed."""
+    steps: list[tuple[Any, ...]] = []
+    source = path.strip()
+    pos = 0
+    length = len(source)
+    # True right after a '.', where a key must follow
+    expect_key = False
+    if source.startswith("$"):
+        pos = 1
+        if source[1:2] == ".":
+            pos = 2
+            expect_key = True
+    while pos < length:
+        char = source[pos]
+        if char == "[" and not expect_key:
+            end = source.find("]", pos)
+            if end == -1:
+                raise ValueError(f"Unclosed bracket in JSON path '{path}'")
+            token = source[pos + 1:end]
+            # A quoted key may itself contain ']'
+            if token[:1] in ("'", '"'):
+                quote_end = source.find(token[0] + "]", pos + 2)
+                if quote_end == -1:
+                    raise ValueError(f"Unclosed quote in JSON path '{path}'")
+                end = quote_end + 1
+                token = source[pos + 1:end]
+            steps.append(_parse_index(path, token))
+            pos = end + 1
+            if pos < length and source[pos] not in ".[":
+                raise ValueError(f"Unexpected '{source[pos]}' after ']' in JSON path '{path}'")
+        elif char == "]":
+            raise ValueError(f"Unexpected ']' in JSON path '{path}'")
+        else:
+            end = pos
+            while end < length and source[end] not in ".[]":
+                end += 1
+            key = source[pos:end]
+            if not key:
+                raise ValueError(f"Empty segment in JSON path '{path}'")
+            steps.append(("wildcard",) if key == "*" else ("key", key))
+            pos = end
+        expect_key = False
+        if pos < length and source[pos] == ".":
+            pos += 1
+            expect_key = True
+    if expect_key:
+        raise ValueError(f"Empty segment in JSON path '{path}'")
+    if not steps:
+        raise ValueError(f"Empty JSON path '{path}'")
+    return JsonPath(path, tuple(steps))
+
+
+class JsonStreamExtractor:
+    """Extract a set of JSON paths from a body fed in chunks.
+
+    Uses ijson's push parser and only builds the values at the requested
+    paths, so the full tree is never materialized. `complete` turns True as
+    soon as every path has been found and the rest of the body can be skipped.
+    """
+
+    def __init__(self, paths: Iterable[JsonPath]) -> None:
+        """Initialize the extractor."""
+        # Location -> every path string pointing at it ("a.b" and "$.a.b" share one)
+        self._targets: dict[tuple[Any, ...], list[str]] = {}
+        for path in paths:
+            names = self._targets.setdefault(tuple(step[1] for step in path.steps), [])
+            if path.path not in names:
+                names.append(path.path)
+        self._path_count = sum(len(names) for names in self._targets.values())
+        self.values: dict[str, Any] = {}
+        self.error: Exception | None = None
+        self._events = ijson.sendable_list()
+        self._parser = ijson.parse_coro(self._events, use_float=True)
+        # Stack of [location, is_array, current key or next index] per open container
+        self._stack: list[list[Any]] = []
+        # Values being built: [path strings, builder, depth]
+        self._builders: list[list[Any]] = []
+
+    @property
+    def complete(self) -> bool:
+        """Return True once every path has been resolved."""
+        return len(self.values) == self._path_count
+
+    @property
+    def done(self) -> bool:
+        """Return True when no more input is needed (complete or invalid JSON)."""
+        return self.error is not None or self.complete
+
+    def feed(self, chunk: bytes) -> None:
+        """Feed the next chunk of the body."""
+        try:
+            self._parser.send(chunk)
+        except ijson.JSONError as err:
+            self._fail(err)
+        self._process()
+
+    def close(self) -> None:
+        """Finish parsing (only when the whole body was fed)."""
+        if self.error is None:
+            try:
+                self._parser.close()
+            except ijson.JSONError as err:
+                self._fail(err)
+        self._process()
+
+    def _fail(self, err: Exception) -> None:
+        """Record invalid JSON; unresolved paths stay None like a failed json.loads."""
+        _LOGGER.debug("Failed to parse streamed response as JSON: %s", err)
+        self.error = err
+
+    def _process(self) -> None:
+        """Consume the events produced so far."""
+        for _prefix, event, value in self._events:
+            if self.complete:
+                break
+            self._handle(event, value)
+        del self._events[:]
+
+    def _handle(self, event: str, value: Any) -> None:
+        """Track the current location and build values at target paths."""
+        for builder in self._builders:
+            builder[1].event(event, value)
+        if event in ("end_map", "end_array"):
+            self._stack.pop()
+            self._finish_builders(len(self._stack))
+            return
+        if event == "map_key":
+            self._stack[-1][2] = value
+            return
+
+        # A value starts here (scalar, map or array)
+        if not self._stack:
+            location: tuple[Any, ...] = ()
+        else:
+            parent = self._stack[-1]
+            if parent[1]:
+                location = (*parent[0], parent[2])
+                parent[2] += 1
+            else:
+                location = (*parent[0], parent[2])
+
+        targets = self._targets.get(location)
+        if targets is not None and targets[0] not in self.values:
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                self._builders.append([targets, builder, len(self._stack)])
+            else:
+                for target in targets:
+                    self.values[target] = value
+
+        if event in ("start_map", "start_array"):
+            self._stack.append([location, event == "start_array", 0])
+
+    def _finish_builders(self, depth: int) -> None:
+        """Store every value whose container just closed."""
+        for builder in [b for b in self._builders if b[2] == depth]:
+            for target in builder[0]:
+                self.values[target] = builder[1].value
+            self._builders.remove(builder)
+
+
+def parse_json(data: str | dict, path: str | JsonPath | None = None) -> Any:
     """Parse JSON data with optional path."""
     try:
         if isinstance(data, str):
@@ -25,93 +684,32 @@ def parse_json(data: str | dict, path: str | None = None) -> Any:
             
         if not path:
             return json_data
-            
-        # Enhanced JSON path support
-        # Support for:
-        # - Simple path: "data.temperature"
-        # - Array index: "items[0].value"
-        # - Multiple indices: "data.items[0].values[1]"
-        # - Bracket notation: "data['temperature']"
-        
-        result = json_data
-        
-        # Replace bracket notation with dot notation
-        path = path.replace("']['", ".").replace("['", ".").replace("']", "").replace("[\"", ".").replace("\"]", "")
         
-        # Split by dots, but handle array indices
-        parts = []
-        current = ""
-        for char in path:
-            if char == ".":
-                if current:
-                    parts.append(current)
-                    current = ""
-            elif char == "[":
-                if current:
-                    parts.append(current)
-                    current = "["
-            else:
-                current += char
-        if current:
-            parts.append(current)
-        
-        for part in parts:
-            if not part:
-                continue
-                
-            if part.startswith("[") and part.endswith("]"):
-                # Array index
-                index = int(part[1:-1])
-                result = result[index]
-            elif "[" in part and "]" in part:
-                # Handle array index in format like "items[0]"
-                key, index_str = part.split("[")
-                index = int(index_str.rstrip("]"))
-                if key:
-                    result = result[key]
-                result = result[index]
-            else:
-                # Regular key
-                result = result[part]
-        
-        return result
-    except (KeyError, IndexError, TypeError) as err:
-        _LOGGER.debug("JSON path error for path '%s': %s", path, err)
-        return None
-    except Exception as err:
+        if isinstance(path, str):
+            path = compile_json_path(path)
+        return path.resolve(json_data)
+    except ValueError as err:
         _LOGGER.error("JSON parsing error: %s", err)
         return None
 
 
-def parse_html(html_content: str, selector: str, value_type: str = "value", attr_name: str | None = None) -> Any:
-    """Parse HTML with CSS selector and value type."""
+def parse_html(html_content: str | BeautifulSoup, selector: str, value_type: str = "value", attr_name: str | None = None) -> Any:
+    """Parse HTML with CSS selector and value type.
+
+    Accepts either raw HTML or an already built tree.
+    """
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        if isinstance(html_content, BeautifulSoup):
+            soup = html_content
+        else:
+            soup = BeautifulSoup(html_content, 'html.parser')
         element = soup.select_one(selector)
         
         if element is None:
             _LOGGER.debug("No element found for selector: %s", selector)
             return None
         
-        if value_type == "value":
-            # Return text content without HTML tags
-            return element.get_text(strip=True)
-        elif value_type == "attribute":
-            # Return specific attribute value
-            if attr_name:
-                return element.get(attr_name)
-            else:
-                _LOGGER.error("Attribute name not specified for attribute type")
-                return None
-        elif value_type == "html":
-            # Return inner HTML
-            return ''.join(str(child) for child in element.children)
-        elif value_type == "outerhtml":
-            # Return outer HTML (including the element itself)
-            return str(element)
-        else:
-            # Default to text
-            return element.get_text(strip=True)
+        return html_element_value(element, value_type, attr_name)
     except Exception as err:
         _LOGGER.error("HTML parsing error: %s", err)
         return None
@@ -140,13 +738,65 @@ def parse_html_full(html_content: str, selector: str) -> str | None:
         return None
 
 
+@lru_cache(maxsize=256)
+def compile_regex(pattern: str) -> Any:
+    """Compile a sensor regex once, raising ValueError if it is malformed.
+
+    Uses the 'regex' package (it supports matching timeouts), falling back
+    to the standard library if it cannot be imported.
+    """
+    try:
+        if regex_module is not None:
+            return regex_module.compile(pattern, regex_module.MULTILINE | regex_module.DOTALL)
+        return re.compile(pattern, re.MULTILINE | re.DOTALL)
+    except Exception as err:
+        raise ValueError(f"Invalid regex '{pattern}': {err}") from err
+
+
+def _match_value(match: Any, groups: int) -> Any:
+    """Return what re.findall would return for one match."""
+    if groups == 0:
+        return match.group(0)
+    if groups == 1:
+        return match.group(1) or ""
+    return match.groups("")
+
+
+def match_text(
+    text: str, regex: str, limit: int | None = None, timeout: float | None = None
+) -> tuple[list[Any] | None, int]:
+    """Return up to `limit` matches (as re.findall would) and the total count.
+
+    Matches are found lazily: only the first `limit` are built, the rest are
+    just counted. With the 'regex' package, matching gives up after `timeout`
+    seconds (catastrophic backtracking) and no matches are returned.
+    """
+    try:
+        compiled = compile_regex(regex)
+    except ValueError as err:
+        _LOGGER.error("Regex error: %s", err)
+        return None, 0
+    
+    kwargs = {"timeout": timeout} if timeout and regex_module is not None else {}
+    try:
+        iterator = compiled.finditer(text, **kwargs)
+        matches = [_match_value(match, compiled.groups) for match in islice(iterator, limit)]
+        total = len(matches)
+        if limit is not None and total == limit:
+            total += sum(1 for _ in iterator)
+    except TimeoutError:
+        _LOGGER.warning("Regex '%s' timed out after %s seconds", regex, timeout)
+        return None, 0
+    return matches or None, total
+
+
 def parse_text(text: str, regex: str | None = None, group: int = 1) -> Any:
     """Parse text with optional regex."""
     if not regex:
         return text
         
     try:
-        match = re.search(regex, text, re.MULTILINE | re.DOTALL)
+        match = compile_regex(regex).search(text)
         if match:
             try:
                 return match.group(group)
@@ -163,29 +813,85 @@ def parse_text_all(text: str, regex: str, max_groups: int | None = None) -> list
     """Parse text and return all regex matches, optionally limited to max_groups."""
     if not regex:
         return None
-        
+    return match_text(text, regex, max_groups)[0]
+
+
+def parse_batch_requests(batch_json: str | None) -> dict[str, dict[str, Any]]:
+    """Parse the batch requests of an entry.
+
+    The config is a JSON object mapping a request key to a request, e.g.
+    {"power": {"url": "http://...", "method": "GET", "headers": {...}}}.
+    Raises ValueError if it is malformed.
+    """
+    if not batch_json or not batch_json.strip():
+        return {}
     try:
-        matches = re.findall(regex, text, re.MULTILINE | re.DOTALL)
-        # Limit to max_groups only if specified
-        if matches and max_groups is not None and len(matches) > max_groups:
-            matches = matches[:max_groups]
-        return matches if matches else None
-    except Exception as err:
-        _LOGGER.error("Regex error: %s", err)
+        requests = json.loads(batch_json)
+    except json.JSONDecodeError as err:
+        raise ValueError(f"Invalid JSON: {err}") from err
+    if not isinstance(requests, dict):
+        raise ValueError("Batch requests must be a JSON object keyed by request key")
+    for key, request in requests.items():
+        if not key or not isinstance(request, dict):
+            raise ValueError(f"Request '{key}' must be a JSON object")
+        if not isinstance(request.get(CONF_URL), str) or not request[CONF_URL]:
+            raise ValueError(f"Request '{key}' has no url")
+        if request.get(CONF_METHOD, "GET") not in HTTP_METHODS:
+            raise ValueError(f"Request '{key}' has an unsupported method")
+        for option in (CONF_HEADERS, CONF_PARAMS, CONF_BODY):
+            if not isinstance(request.get(option) or {}, dict):
+                raise ValueError(f"Request '{key}' {option} must be a JSON object")
+    return requests
+
+
+def compile_template(hass: HomeAssistant, template_str: str | None) -> template_helper.Template | None:
+    """Compile a value template once so it can be reused across refreshes."""
+    if not template_str:
         return None
+    template = template_helper.Template(template_str, hass)
+    try:
+        template.ensure_valid()
+    except TemplateError as err:
+        _LOGGER.error("Template error: %s", err)
+    return template
 
 
-async def render_template(
+def compile_attributes_template(hass: HomeAssistant, template_str: str | None) -> dict[str, Any]:
+    """Parse the attributes template JSON once and compile each value template."""
+    if not template_str:
+        return {}
+        
+    try:
+        attributes_config = json.loads(template_str)
+    except json.JSONDecodeError as err:
+        _LOGGER.error("Invalid JSON in attributes template: %s", err)
+        return {}
+    if not isinstance(attributes_config, dict):
+        _LOGGER.error("Attributes template must be a JSON object")
+        return {}
+    
+    compiled: dict[str, Any] = {}
+    for key, value_template in attributes_config.items():
+        if isinstance(value_template, str):
+            compiled[key] = compile_template(hass, value_template)
+        else:
+            # If not a string, use as-is
+            compiled[key] = value_template
+    return compiled
+
+
+def render_template(
     hass: HomeAssistant,
-    template_str: str,
+    template: str | template_helper.Template | None,
     variables: dict[str, Any],
 ) -> Any:
-    """Render a template with the given variables."""
-    if not template_str:
+    """Render a template (string or precompiled) with the given variables."""
+    if not template:
         return variables.get("value")
         
     try:
-        template = template_helper.Template(template_str, hass)
+        if isinstance(template, str):
+            template = template_helper.Template(template, hass)
         result = template.async_render(variables)
         return result
     except TemplateError as err:
@@ -196,33 +902,30 @@ async def render_template(
         return variables.get("value")
 
 
-async def render_attributes_template(
+def render_attributes_template(
     hass: HomeAssistant,
-    template_str: str,
+    template: str | dict[str, Any] | None,
     variables: dict[str, Any],
 ) -> dict[str, Any]:
-    """Render attributes template and return dictionary."""
-    if not template_str:
+    """Render attributes template (JSON string or precompiled) and return dictionary."""
+    if not template:
         return {}
         
     try:
-        # First, parse the JSON structure
-        attributes_config = json.loads(template_str)
+        # Accept the raw JSON config for callers that did not precompile it
+        if isinstance(template, str):
+            template = compile_attributes_template(hass, template)
         
-        # Then render each value as a template
+        # Render each value as a template
         rendered_attributes = {}
-        for key, value_template in attributes_config.items():
-            if isinstance(value_template, str):
-                template = template_helper.Template(value_template, hass)
-                rendered_attributes[key] = template.async_render(variables)
+        for key, value_template in template.items():
+            if isinstance(value_template, template_helper.Template):
+                rendered_attributes[key] = value_template.async_render(variables)
             else:
-                # If not a string, use as-is
+                # If not a template, use as-is
                 rendered_attributes[key] = value_template
         
         return rendered_attributes
-    except json.JSONDecodeError as err:
-        _LOGGER.error("Invalid JSON in attributes template: %s", err)
-        return {}
     except TemplateError as err:
         _LOGGER.error("Template error in attributes: %s", err)
         return {}
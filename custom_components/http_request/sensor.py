@@ -1,22 +1,35 @@
 """Support for HTTP Request sensors."""
 from __future__ import annotations
 
+import asyncio
+import codecs
+import hashlib
 import json
 import logging
-from datetime import timedelta
+import random
+import time
+from collections import deque
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
 from typing import Any
 
 import aiohttp
 import async_timeout
 
-from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_NAME, CONF_UNIT_OF_MEASUREMENT
-from homeassistant.core import HomeAssistant
+from homeassistant.const import CONF_NAME, CONF_UNIT_OF_MEASUREMENT, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
@@ -25,6 +38,11 @@ from homeassistant.helpers.update_coordinator import (
 from homeassistant.util import dt as dt_util
 
 from .const import (
+    CONF_ATTRIBUTE_BUDGET,
+    BREAKER_BASE_BACKOFF,
+    CONF_ADAPTIVE_INTERVAL,
+    CACHE_SAVE_DELAY,
+    CACHE_STORAGE_VERSION,
     CONF_BODY,
     CONF_HEADERS,
     CONF_HTML_ATTR,
@@ -33,29 +51,109 @@ from .const import (
     CONF_HTML_ATTR_NAME,
     CONF_JSON_PATH,
     CONF_METHOD,
+    CONF_MIN_SCAN_INTERVAL,
     CONF_PARAMS,
     CONF_RESPONSE_TYPE,
     CONF_SCAN_INTERVAL,
+    CONF_SENSOR_UPDATE_ATTRIBUTE,
     CONF_SENSOR_NAME,
     CONF_TEXT_GROUP,
     CONF_TEXT_GROUP_COUNT,
+    CONF_TEXT_MATCH_LIMIT,
     CONF_TEXT_REGEX,
     CONF_TIMEOUT,
+    CONF_TIMING_SENSORS,
+    CONF_COMPACT_RETENTION,
     CONF_URL,
     CONF_VALUE_TEMPLATE,
     CONF_VERIFY_SSL,
+    CONF_WRITE_CHANGES_ONLY,
     CONF_ATTRIBUTES_TEMPLATE,
+    CONF_BATCH_CONCURRENCY,
+    CONF_BATCH_REQUESTS,
     CONF_KEEP_LAST_VALUE,
+    CONF_COALESCE_REQUESTS,
+    CONF_CONDITIONAL_REQUESTS,
+    CONF_CONNECTION_POOL,
+    CONF_DNS_CACHE_TTL,
+    CONF_FAILURE_THRESHOLD,
+    CONF_HEADER_ALLOWLIST,
+    CONF_HOST_CONCURRENCY,
+    CONF_HOST_RATE_LIMIT,
+    CONF_HTML_PARSER,
+    CONF_JSON_STREAMING,
+    CONF_KEEPALIVE_TIMEOUT,
+    CONF_MAX_BACKOFF,
+    CONF_MAX_RESPONSE_SIZE,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_PARSE_THRESHOLD,
+    CONF_PERSISTENT_CACHE,
+    CONF_POOL_LIMIT_PER_HOST,
+    CONF_REGEX_TIMEOUT,
+    CONF_REQUEST_JITTER,
+    CONF_REQUEST_KEY,
+    CONF_RESPONSE_CACHE_TTL,
+    CONF_SKIP_UNCHANGED,
+    DEFAULT_ADAPTIVE_INTERVAL,
+    DEFAULT_ATTRIBUTE_BUDGET,
+    DEFAULT_BATCH_CONCURRENCY,
+    DEFAULT_COALESCE_REQUESTS,
+    DEFAULT_CONDITIONAL_REQUESTS,
+    DEFAULT_CONNECTION_POOL,
+    DEFAULT_DNS_CACHE_TTL,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_HEADER_ALLOWLIST,
+    DEFAULT_HOST_CONCURRENCY,
+    DEFAULT_HOST_RATE_LIMIT,
+    DEFAULT_HTML_PARSER,
+    DEFAULT_JSON_STREAMING,
+    DEFAULT_KEEPALIVE_TIMEOUT,
+    DEFAULT_MAX_BACKOFF,
+    DEFAULT_MAX_RESPONSE_SIZE,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_METHOD,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_PARSE_THRESHOLD,
+    DEFAULT_PERSISTENT_CACHE,
+    DEFAULT_POOL_LIMIT_PER_HOST,
+    DEFAULT_REGEX_TIMEOUT,
+    DEFAULT_REQUEST_JITTER,
+    DEFAULT_RESPONSE_CACHE_TTL,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_SENSOR_NAME,
+    DEFAULT_SENSOR_UPDATE_ATTRIBUTE,
+    DEFAULT_SKIP_UNCHANGED,
     DEFAULT_TEXT_GROUP_COUNT,
+    DEFAULT_TEXT_MATCH_LIMIT,
     DEFAULT_TIMEOUT,
+    DEFAULT_TIMING_SENSORS,
+    DEFAULT_COMPACT_RETENTION,
     DEFAULT_VERIFY_SSL,
+    DEFAULT_WRITE_CHANGES_ONLY,
     DOMAIN,
+    DOMAIN_DATA,
     MANUFACTURER,
     MODEL,
+    READ_CHUNK_SIZE,
+    TIMING_STAGES,
+    TIMING_WINDOW,
+)
+from .parser import (
+    ExtractionPlan,
+    JsonStreamExtractor,
+    ResponseDocument,
+    build_document,
+    build_streamed_document,
+    compile_attributes_template,
+    compile_json_path,
+    compile_regex,
+    compile_template,
+    html_spec_from_config,
+    match_text,
+    parse_batch_requests,
+    render_attributes_template,
+    render_template,
 )
-from .parser import parse_html, parse_html_full, parse_json, parse_text, parse_text_all, render_template, render_attributes_template
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -66,15 +164,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the HTTP Request sensor."""
-    # Check if coordinator already exists (created by binary_sensor)
-    if hass.data[DOMAIN][config_entry.entry_id]["coordinator"] is not None:
-        coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
-    else:
-        # Create new coordinator if not exists
-        coordinator = HttpRequestDataUpdateCoordinator(hass, config_entry)
-        hass.data[DOMAIN][config_entry.entry_id]["coordinator"] = coordinator
-        # Do initial refresh
-        await coordinator.async_config_entry_first_refresh()
+    coordinator = hass.data[DOMAIN][config_entry.entry_id]["coordinator"]
     
     # Get sensors configuration
     sensors_config = config_entry.data.get("sensors", [])
@@ -86,10 +176,206 @@ async def async_setup_entry(
             sensors.append(
                 HttpRequestSensor(coordinator, config_entry, sensor_config, idx)
             )
-        async_add_entities(sensors, True)
     else:
-        # No sensors configured, just pass empty list
-        async_add_entities([], True)
+        sensors = []
+    
+    # Optional diagnostic sensors with rolling per-stage timings
+    if config_entry.data.get(CONF_TIMING_SENSORS, DEFAULT_TIMING_SENSORS):
+        sensors.extend(
+            HttpRequestTimingSensor(coordinator, config_entry, stage) for stage in TIMING_STAGES
+        )
+    
+    # State is computed from the coordinator's data when the entities are added
+    async_add_entities(sensors)
+
+
+def apply_attribute_budget(
+    attributes: dict[str, Any], budget: int, protected: Iterable[str] = ()
+) -> dict[str, Any]:
+    """Drop the largest attributes until the JSON size fits the budget (bytes).
+
+    Protected keys are never dropped; the names of dropped attributes are
+    listed in 'truncated_attributes'.
+    """
+    if budget <= 0:
+        return attributes
+    sizes = {
+        key: len(json.dumps(value, default=str)) + len(key) + 4
+        for key, value in attributes.items()
+    }
+    total = sum(sizes.values())
+    if total <= budget:
+        return attributes
+    
+    protected = set(protected)
+    dropped: list[str] = []
+    for key in sorted(sizes, key=sizes.get, reverse=True):
+        if total <= budget:
+            break
+        if key in protected:
+            continue
+        dropped.append(key)
+        total -= sizes[key]
+    if not dropped:
+        return attributes
+    attributes = {key: value for key, value in attributes.items() if key not in dropped}
+    attributes["truncated_attributes"] = dropped
+    return attributes
+
+
+class CircuitBreaker:
+    """Stop requesting a failing endpoint for an exponential, jittered backoff.
+
+    After `threshold` consecutive failures the circuit opens and requests are
+    skipped until the retry time. Then one probe request is let through
+    (half-open): success closes the circuit, failure opens it again with the
+    backoff doubled, up to `max_backoff`.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, threshold: int, base_backoff: float, max_backoff: float) -> None:
+        """Initialize."""
+        self.threshold = threshold
+        self.base_backoff = base_backoff
+        self.max_backoff = max_backoff
+        self.state = self.CLOSED
+        self.failures = 0
+        self.next_retry: datetime | None = None
+        self._openings = 0
+
+    def allow_request(self) -> bool:
+        """Return True if a request may be sent now."""
+        if self.state == self.OPEN:
+            if dt_util.utcnow() < self.next_retry:
+                return False
+            self.state = self.HALF_OPEN
+        return True
+
+    def record_success(self) -> bool:
+        """Close the circuit; return True if it was not closed before."""
+        recovered = self.state != self.CLOSED
+        self.state = self.CLOSED
+        self.failures = 0
+        self.next_retry = None
+        self._openings = 0
+        return recovered
+
+    def record_failure(self) -> float | None:
+        """Count a failure; return the backoff (seconds) if the circuit opened."""
+        self.failures += 1
+        if self.threshold <= 0:
+            return None
+        if self.state != self.HALF_OPEN and self.failures < self.threshold:
+            return None
+        
+        backoff = min(self.base_backoff * 2 ** self._openings, self.max_backoff)
+        # Jitter so entries that failed together do not retry together
+        backoff *= random.uniform(0.75, 1.25)
+        self._openings += 1
+        self.state = self.OPEN
+        self.next_retry = dt_util.utcnow() + timedelta(seconds=backoff)
+        return backoff
+
+
+class TimingStats:
+    """Rolling window of stage timings (ms) with percentiles."""
+
+    def __init__(self, window: int = TIMING_WINDOW) -> None:
+        """Initialize."""
+        self._samples: dict[str, deque[float]] = {}
+        self._window = window
+
+    def record(self, stage: str, value: float) -> None:
+        """Add one timing sample for a stage."""
+        samples = self._samples.get(stage)
+        if samples is None:
+            samples = self._samples[stage] = deque(maxlen=self._window)
+        samples.append(value)
+
+    def record_all(self, timings: dict[str, float]) -> None:
+        """Add the timings of one refresh."""
+        for stage, value in timings.items():
+            self.record(stage, value)
+
+    def percentiles(self, stage: str) -> dict[str, float] | None:
+        """Return count, p50, p90, p99 and max of a stage, or None without samples."""
+        samples = self._samples.get(stage)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        last = len(ordered) - 1
+        return {
+            "count": len(ordered),
+            "p50": ordered[round(0.5 * last)],
+            "p90": ordered[round(0.9 * last)],
+            "p99": ordered[round(0.99 * last)],
+            "max": ordered[last],
+        }
+
+    def as_dict(self) -> dict[str, dict[str, float]]:
+        """Return the percentiles of every stage."""
+        return {stage: self.percentiles(stage) for stage in self._samples if self._samples[stage]}
+
+
+@dataclass
+class RequestSpec:
+    """One HTTP request fetched by a coordinator, with its per-request state."""
+
+    key: str
+    url: str
+    method: str = "GET"
+    headers: dict[str, Any] = field(default_factory=dict)
+    params: dict[str, Any] = field(default_factory=dict)
+    body: dict[str, Any] = field(default_factory=dict)
+    plan: ExtractionPlan = field(default_factory=ExtractionPlan)
+    # Stream JSON paths instead of parsing the whole body
+    streaming: bool = False
+    # Validators and content hash of the last full response
+    etag: str | None = None
+    last_modified: str | None = None
+    body_hash: str | None = None
+
+
+@dataclass(frozen=True)
+class RawResponse:
+    """An HTTP response as received, before parsing; shared by coalesced requests."""
+
+    status: int
+    headers: Any
+    content_type: str
+    text: str
+    content_length: int
+    body_hash: str
+    # Seconds spent waiting for a scheduler slot
+    wait: float = 0.0
+    # Network stage timings (ms): jitter, dns, connect, ttfb, download
+    stages: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class RequestResult:
+    """Latest result of one request, shared by every entity reading it.
+
+    With compact retention the document keeps only the values the sensors
+    read and the headers only the allowlisted ones.
+    """
+
+    document: ResponseDocument
+    status: int
+    headers: Mapping[str, str]
+    content_type: str
+    content_length: int
+    source: str
+    timings: dict[str, float]
+    parse_count: int = 0
+    parse_mode: str | None = None
+    not_modified: bool = False
+    unchanged: bool = False
+    # Results of the other requests of a batch entry (None if one failed)
+    requests: dict[str, RequestResult | None] | None = None
 
 
 class HttpRequestDataUpdateCoordinator(DataUpdateCoordinator):
@@ -110,12 +396,114 @@ class HttpRequestDataUpdateCoordinator(DataUpdateCoordinator):
         self.timeout = config_entry.data.get(CONF_TIMEOUT, DEFAULT_TIMEOUT)
         self.verify_ssl = config_entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
         self.response_type = config_entry.data.get(CONF_RESPONSE_TYPE, "json")
+        # Responses larger than this (bytes) are rejected while streaming
+        self.max_response_size = config_entry.data.get(CONF_MAX_RESPONSE_SIZE, DEFAULT_MAX_RESPONSE_SIZE) * 1024
+        # Payloads larger than this (bytes) are parsed in the executor
+        self.parse_threshold = config_entry.data.get(CONF_PARSE_THRESHOLD, DEFAULT_PARSE_THRESHOLD) * 1024
+        
+        # Conditional requests (ETag / Last-Modified) and their savings
+        self.conditional_requests = config_entry.data.get(
+            CONF_CONDITIONAL_REQUESTS, DEFAULT_CONDITIONAL_REQUESTS
+        )
+        self.not_modified_count = 0
+        self.bytes_saved = 0
+        
+        # Content hash change detection: unchanged bodies skip all sensor work
+        self.skip_unchanged = config_entry.data.get(CONF_SKIP_UNCHANGED, DEFAULT_SKIP_UNCHANGED)
+        self.unchanged_count = 0
         
         # Parse JSON configs
         self.headers = self._parse_json_config(config_entry.data.get(CONF_HEADERS, ""))
         self.params = self._parse_json_config(config_entry.data.get(CONF_PARAMS, ""))
         self.body = self._parse_json_config(config_entry.data.get(CONF_BODY, ""))
         
+        # Requests fetched on every tick: the entry's own request plus batch requests
+        self.batch_concurrency = config_entry.data.get(CONF_BATCH_CONCURRENCY, DEFAULT_BATCH_CONCURRENCY)
+        self.requests = [
+            RequestSpec(
+                key="",
+                url=self.url,
+                method=self.method,
+                headers=self.headers,
+                params=self.params,
+                body=self.body,
+            )
+        ]
+        try:
+            batch_requests = parse_batch_requests(config_entry.data.get(CONF_BATCH_REQUESTS))
+        except ValueError as err:
+            _LOGGER.error("Invalid batch requests for %s: %s", config_entry.title, err)
+            batch_requests = {}
+        for key, request in batch_requests.items():
+            self.requests.append(
+                RequestSpec(
+                    key=key,
+                    url=request[CONF_URL],
+                    method=request.get(CONF_METHOD, DEFAULT_METHOD),
+                    headers=request.get(CONF_HEADERS) or {},
+                    params=request.get(CONF_PARAMS) or {},
+                    body=request.get(CONF_BODY) or {},
+                )
+            )
+        
+        # What each request's sensors extract, resolved in one pass per refresh
+        sensors = config_entry.data.get("sensors", [])
+        html_parser = config_entry.data.get(CONF_HTML_PARSER, DEFAULT_HTML_PARSER)
+        # Text regexes: matches kept for templates and a backtracking guard
+        self.text_match_limit = config_entry.data.get(CONF_TEXT_MATCH_LIMIT, DEFAULT_TEXT_MATCH_LIMIT)
+        self.regex_timeout = config_entry.data.get(CONF_REGEX_TIMEOUT, DEFAULT_REGEX_TIMEOUT) or None
+        json_streaming = self.response_type == "json" and config_entry.data.get(
+            CONF_JSON_STREAMING, DEFAULT_JSON_STREAMING
+        )
+        for spec in self.requests:
+            spec.plan = ExtractionPlan.from_sensors(
+                [s for s in sensors if s.get(CONF_REQUEST_KEY, "") == spec.key],
+                html_parser=html_parser,
+                match_limit=self.text_match_limit,
+                regex_timeout=self.regex_timeout,
+            )
+            # Streaming JSON extraction: only the sensors' paths are built, reading stops early
+            if json_streaming:
+                if spec.plan.streamable:
+                    spec.streaming = True
+                else:
+                    _LOGGER.info(
+                        "Streaming JSON disabled for %s: it needs ijson, sensors with simple "
+                        "JSON paths only, and templates that read 'response' by constant keys only",
+                        spec.url,
+                    )
+        self.plan = self.requests[0].plan
+        
+        # Optional dedicated connection pool (tuned keep-alive, DNS cache, per-host limit)
+        self.pools = hass.data[DOMAIN_DATA]["pools"]
+        self.connection_pool = config_entry.data.get(CONF_CONNECTION_POOL, DEFAULT_CONNECTION_POOL)
+        self.pool_limit_per_host = config_entry.data.get(CONF_POOL_LIMIT_PER_HOST, DEFAULT_POOL_LIMIT_PER_HOST)
+        self.dns_cache_ttl = config_entry.data.get(CONF_DNS_CACHE_TTL, DEFAULT_DNS_CACHE_TTL)
+        self.keepalive_timeout = config_entry.data.get(CONF_KEEPALIVE_TIMEOUT, DEFAULT_KEEPALIVE_TIMEOUT)
+        
+        # Request coalescing: identical requests across entries share one network call
+        self.coalescer = hass.data[DOMAIN_DATA]["coalescer"]
+        self.coalesce_requests = config_entry.data.get(CONF_COALESCE_REQUESTS, DEFAULT_COALESCE_REQUESTS)
+        self.response_cache_ttl = config_entry.data.get(CONF_RESPONSE_CACHE_TTL, DEFAULT_RESPONSE_CACHE_TTL)
+        self.coalesced_count = 0
+        self.cache_hit_count = 0
+        
+        # Domain-wide scheduler: per-host concurrency and rate limits, refresh jitter
+        self.scheduler = hass.data[DOMAIN_DATA]["scheduler"]
+        self.request_jitter = config_entry.data.get(CONF_REQUEST_JITTER, DEFAULT_REQUEST_JITTER)
+        self.scheduler.register(
+            config_entry.entry_id,
+            [spec.url for spec in self.requests],
+            config_entry.data.get(CONF_HOST_CONCURRENCY, DEFAULT_HOST_CONCURRENCY),
+            config_entry.data.get(CONF_HOST_RATE_LIMIT, DEFAULT_HOST_RATE_LIMIT),
+        )
+        
+        # Persistent cache of the last responses, served at startup while revalidating
+        self.persistent_cache = config_entry.data.get(CONF_PERSISTENT_CACHE, DEFAULT_PERSISTENT_CACHE)
+        self._store: Store | None = None
+        if self.persistent_cache:
+            self._store = Store(hass, CACHE_STORAGE_VERSION, f"{DOMAIN}.cache.{config_entry.entry_id}")
+        
         # Get update interval
         scan_interval = config_entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
         
@@ -126,8 +514,50 @@ class HttpRequestDataUpdateCoordinator(DataUpdateCoordinator):
             update_interval=timedelta(seconds=scan_interval),
         )
         
+        # Adaptive polling: the interval follows the observed change rate within bounds
+        self.scan_interval = scan_interval
+        self.adaptive_interval = config_entry.data.get(CONF_ADAPTIVE_INTERVAL, DEFAULT_ADAPTIVE_INTERVAL)
+        self.min_scan_interval = config_entry.data.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL)
+        self.max_scan_interval = max(
+            config_entry.data.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+            self.min_scan_interval,
+        )
+        self.change_rate = 0.0
+        self._interval_before_errors: float | None = None
+        
+        # State writes: skip writes that record nothing new, optional timestamp attribute
+        self.write_changes_only = config_entry.data.get(CONF_WRITE_CHANGES_ONLY, DEFAULT_WRITE_CHANGES_ONLY)
+        self.sensor_update_attribute = config_entry.data.get(
+            CONF_SENSOR_UPDATE_ATTRIBUTE, DEFAULT_SENSOR_UPDATE_ATTRIBUTE
+        )
+        
+        # Attribute size budget and the response headers shown on the info entity
+        self.attribute_budget = config_entry.data.get(CONF_ATTRIBUTE_BUDGET, DEFAULT_ATTRIBUTE_BUDGET)
+        header_allowlist = config_entry.data.get(CONF_HEADER_ALLOWLIST, DEFAULT_HEADER_ALLOWLIST)
+        self.header_allowlist = {
+            name.strip().lower() for name in header_allowlist.split(",") if name.strip()
+        }
+        
+        # Compact retention: release the body once the sensors' values are extracted
+        self.compact_retention = config_entry.data.get(CONF_COMPACT_RETENTION, DEFAULT_COMPACT_RETENTION)
+        
+        # Circuit breaker: back off from an endpoint that keeps failing
+        self.breaker = CircuitBreaker(
+            config_entry.data.get(CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD),
+            BREAKER_BASE_BACKOFF,
+            config_entry.data.get(CONF_MAX_BACKOFF, DEFAULT_MAX_BACKOFF),
+        )
+        
         # Store last update time
         self.last_update_success_time = None
+        
+        # Per-stage timings (ms) of the last refresh and where parsing ran
+        self.timings: dict[str, float] = {}
+        # Rolling per-stage timings for diagnostics (sensors add their render time)
+        self.timing_stats = TimingStats()
+        self.parse_mode: str | None = None
+        # Render time (ms) of all sensors in the current update, None if none rendered
+        self.render_time: float | None = None
 
     def _parse_json_config(self, json_str: str) -> dict[str, Any]:
         """Parse JSON string from config."""
@@ -139,73 +569,477 @@ class HttpRequestDataUpdateCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Failed to parse JSON: %s", json_str)
             return {}
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from HTTP endpoint."""
-        session = async_get_clientsession(self.hass, verify_ssl=self.verify_ssl)
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners and record their total render time as one sample."""
+        self.render_time = None
+        super().async_update_listeners()
+        if self.render_time is not None:
+            self.timing_stats.record("render", round(self.render_time, 2))
+
+    def get_result(self, key: str = "") -> RequestResult | None:
+        """Return the latest result of the request with this key ('' is the entry's own)."""
+        if self.data is None:
+            return None
+        if not key:
+            return self.data
+        return (self.data.requests or {}).get(key)
+
+    def filter_headers(self, headers: Mapping[str, str]) -> dict[str, str]:
+        """Return the allowlisted response headers ('*' allows all)."""
+        return {
+            name: value
+            for name, value in headers.items()
+            if "*" in self.header_allowlist or name.lower() in self.header_allowlist
+        }
+
+    async def _async_read_body(
+        self,
+        response: aiohttp.ClientResponse,
+        extractor: JsonStreamExtractor | None = None,
+    ) -> tuple[str, int, str]:
+        """Stream the body, enforcing the size limit.
+
+        Returns the decoded text, the number of bytes received and a content
+        hash. Bytes are counted, hashed and decoded chunk by chunk, so the body
+        is never held as both bytes and text. With an extractor the chunks are
+        fed to it instead of being decoded, and reading stops as soon as every
+        JSON path has been found; the hash then covers the bytes read.
+        """
+        if response.content_length is not None and response.content_length > self.max_response_size:
+            raise UpdateFailed(
+                f"Response size {response.content_length} exceeds limit of {self.max_response_size} bytes"
+            )
+        
+        try:
+            decoder = codecs.getincrementaldecoder(response.charset or "utf-8")()
+        except LookupError:
+            decoder = codecs.getincrementaldecoder("utf-8")()
+        hasher = hashlib.blake2b(digest_size=16)
+        parts: list[str] = []
+        size = 0
+        
+        async for chunk in response.content.iter_chunked(READ_CHUNK_SIZE):
+            size += len(chunk)
+            if size > self.max_response_size:
+                raise UpdateFailed(
+                    f"Response exceeds limit of {self.max_response_size} bytes"
+                )
+            hasher.update(chunk)
+            if extractor is not None:
+                extractor.feed(chunk)
+                if extractor.done:
+                    break
+            else:
+                parts.append(decoder.decode(chunk))
+        else:
+            if extractor is not None:
+                extractor.close()
+        parts.append(decoder.decode(b"", final=True))
+        
+        return "".join(parts), size, hasher.hexdigest()
+
+    def should_offload(self, size: int) -> bool:
+        """Return True if a payload of this size should be parsed off the event loop."""
+        return size > self.parse_threshold
+
+    async def _async_parse(
+        self, text: str, size: int, plan: ExtractionPlan
+    ) -> tuple[ResponseDocument, str]:
+        """Run the parsing stage, in the executor for large payloads."""
+        if self.should_offload(size):
+            document = await self.hass.async_add_executor_job(
+                build_document, text, self.response_type, plan
+            )
+            parse_mode = "executor"
+        else:
+            document, parse_mode = build_document(text, self.response_type, plan), "inline"
+        if self.compact_retention:
+            # Keep the extracted values only; the body and tree can be freed
+            document = document.compact(plan)
+        return document, parse_mode
+
+    def _request_kwargs(self, spec: RequestSpec, previous: RequestResult | None) -> dict[str, Any]:
+        """Build the aiohttp request arguments for a request."""
+        kwargs: dict[str, Any] = {
+            "method": spec.method,
+            "url": spec.url,
+        }
+        
+        headers = dict(spec.headers)
+        if self.conditional_requests and previous is not None:
+            # Revalidate the cached response instead of downloading it again
+            if spec.etag:
+                headers["If-None-Match"] = spec.etag
+            if spec.last_modified:
+                headers["If-Modified-Since"] = spec.last_modified
+        if headers:
+            kwargs["headers"] = headers
+        
+        # Handle params differently for POST/PUT/PATCH
+        if spec.method in ["POST", "PUT", "PATCH"]:
+            if spec.params:
+                kwargs["data"] = spec.params  # Use data for form params
+            if spec.body:
+                kwargs["json"] = spec.body
+        else:
+            if spec.params:
+                kwargs["params"] = spec.params  # Use params for query string
+        return kwargs
+
+    async def _async_download(
+        self,
+        session: aiohttp.ClientSession,
+        spec: RequestSpec,
+        kwargs: dict[str, Any],
+        extractor: JsonStreamExtractor | None = None,
+    ) -> RawResponse:
+        """Send one request over the network and read its body."""
+        # Network stage timings (ms); the dedicated pool's trace config adds dns and connect
+        stages: dict[str, float] = {}
+        # Spread out refreshes (including the first one after a restart), then
+        # queue behind other requests to the same host
+        delay = await self.scheduler.async_jitter(spec.url, self.request_jitter)
+        stages["jitter"] = round(delay * 1000, 2)
+        async with self.scheduler.async_slot(spec.url) as wait:
+            async with async_timeout.timeout(self.timeout):
+                request_start = time.perf_counter()
+                async with session.request(**kwargs, trace_request_ctx=stages) as response:
+                    headers_end = time.perf_counter()
+                    text, content_length, body_hash = await self._async_read_body(response, extractor)
+                    stages["ttfb"] = round((headers_end - request_start) * 1000, 2)
+                    stages["download"] = round((time.perf_counter() - headers_end) * 1000, 2)
+                    return RawResponse(
+                        status=response.status,
+                        headers=response.headers,
+                        content_type=response.content_type,
+                        text=text,
+                        content_length=content_length,
+                        body_hash=body_hash,
+                        wait=wait,
+                        stages=stages,
+                    )
+
+    async def _async_fetch(self, session: aiohttp.ClientSession, spec: RequestSpec) -> RequestResult:
+        """Fetch and parse one request, returning its result."""
+        previous = self.get_result(spec.key)
+        kwargs = self._request_kwargs(spec, previous)
         
         try:
-            # Prepare request
-            kwargs = {
-                "method": self.method,
-                "url": self.url,
+            extractor = JsonStreamExtractor(spec.plan.json_paths) if spec.streaming else None
+            fetch_start = time.perf_counter()
+            if self.coalesce_requests and extractor is None:
+                # Identical requests from any entry share one network call (and a short cache);
+                # settings that can change the outcome are part of the key
+                raw, source = await self.coalescer.async_request(
+                    self.coalescer.fingerprint(
+                        kwargs, self.verify_ssl, self.timeout, self.max_response_size
+                    ),
+                    self.response_cache_ttl,
+                    lambda: self._async_download(session, spec, kwargs),
+                )
+            else:
+                raw, source = await self._async_download(session, spec, kwargs, extractor), "network"
+            fetch_end = time.perf_counter()
+            if source == "coalesced":
+                self.coalesced_count += 1
+            elif source == "cache":
+                self.cache_hit_count += 1
+            
+            status = raw.status
+            response_headers = raw.headers
+            text = raw.text
+            content_length = raw.content_length
+            body_hash = raw.body_hash
+            queue_ms = round(raw.wait * 1000, 2) if source == "network" else 0.0
+            jitter_ms = raw.stages.get("jitter", 0.0) if source == "network" else 0.0
+            fetch_ms = round((fetch_end - fetch_start) * 1000 - queue_ms - jitter_ms, 2)
+            # Network stages belong to the call that went over the network
+            fetch_timings = {
+                "queue": queue_ms,
+                **(raw.stages if source == "network" else {}),
+                "fetch": fetch_ms,
             }
             
-            if self.headers:
-                kwargs["headers"] = self.headers
+            if status == 304 and previous is not None:
+                # Not modified: reuse the previous document without parsing
+                self.not_modified_count += 1
+                self.bytes_saved += previous.content_length or 0
+                return replace(
+                    previous,
+                    not_modified=True,
+                    unchanged=True,
+                    parse_count=0,
+                    parse_mode="skipped",
+                    source=source,
+                    timings={**fetch_timings, "parse": 0.0},
+                    requests=None,
+                )
+            
+            if self.conditional_requests:
+                spec.etag = response_headers.get("ETag")
+                spec.last_modified = response_headers.get("Last-Modified")
             
-            # Handle params differently for POST/PUT/PATCH
-            if self.method in ["POST", "PUT", "PATCH"]:
-                if self.params:
-                    kwargs["data"] = self.params  # Use data for form params
-                if self.body:
-                    kwargs["json"] = self.body
+            # Identical body and status: reuse the previous document without parsing
+            if (
+                self.skip_unchanged
+                and previous is not None
+                and body_hash == spec.body_hash
+                and status == previous.status
+            ):
+                self.unchanged_count += 1
+                return replace(
+                    previous,
+                    headers=self._retained_headers(response_headers),
+                    not_modified=False,
+                    unchanged=True,
+                    parse_count=0,
+                    parse_mode="skipped",
+                    source=source,
+                    timings={**fetch_timings, "parse": 0.0},
+                    requests=None,
+                )
+            spec.body_hash = body_hash
+            
+            # Parse the body once; every sensor reuses this document
+            if extractor is not None:
+                # Already parsed while streaming
+                parse_mode = "streaming"
+                document = build_streamed_document(extractor, self.response_type, spec.plan)
             else:
-                if self.params:
-                    kwargs["params"] = self.params  # Use params for query string
-                    
-            async with async_timeout.timeout(self.timeout):
-                async with session.request(**kwargs) as response:
-                    text = await response.text()
-                    status = response.status
-                    
-                    # Get response headers
-                    response_headers = response.headers
-                    content_type = response.content_type
-                    # Calculate actual content length from response text
-                    content_length = len(text.encode('utf-8')) if text else 0
-                    
-                    # Try to parse as JSON if needed
-                    json_data = None
-                    if self.response_type == "json":
-                        try:
-                            json_data = await response.json(content_type=None)
-                        except Exception:
-                            _LOGGER.debug("Failed to parse response as JSON")
-                    
-                    # Update last success time
-                    self.last_update_success_time = dt_util.now()
-                    
-                    # Store response data
-                    return {
-                        "text": text,
-                        "json": json_data,
-                        "status": status,
-                        "headers": response_headers,
-                        "content_type": content_type,
-                        "content_length": content_length,
-                    }
+                document, parse_mode = await self._async_parse(text, content_length, spec.plan)
+            parse_end = time.perf_counter()
+            
+            return RequestResult(
+                document=document,
+                status=status,
+                headers=self._retained_headers(response_headers),
+                content_type=raw.content_type,
+                content_length=content_length,
+                source=source,
+                timings={**fetch_timings, "parse": round((parse_end - fetch_end) * 1000, 2)},
+                parse_count=document.parse_count,
+                parse_mode=parse_mode,
+            )
                     
+        except UpdateFailed:
+            raise
         except aiohttp.ClientError as err:
             raise UpdateFailed(f"Error communicating with API: {err}") from err
         except Exception as err:
-            _LOGGER.exception("Unexpected error fetching data")
-            raise UpdateFailed(f"Unexpected error: {err}") from err
+            _LOGGER.debug("Unexpected error fetching %s", spec.url, exc_info=True)
+            raise UpdateFailed(f"Unexpected error: {type(err).__name__}: {err}") from err
+
+    def _retained_headers(self, headers: Mapping[str, str]) -> Mapping[str, str]:
+        """Return the response headers to keep with a result."""
+        if self.compact_retention:
+            return self.filter_headers(headers)
+        return headers
+
+    async def async_restore_cache(self) -> bool:
+        """Load the cached responses as current data; return False if there are none.
+
+        Every cached body is parsed again with the current sensors, so the
+        cache stays valid across sensor changes. Streamed requests keep no
+        body and are not cached.
+        """
+        cached = await self._store.async_load()
+        if not cached:
+            return False
+        
+        responses = cached.get("requests", {})
+        results: dict[str, RequestResult | None] = {}
+        for spec in self.requests:
+            entry = responses.get(spec.key)
+            if entry is None or spec.streaming or entry.get("url") != spec.url:
+                results[spec.key] = None
+                continue
+            
+            parse_start = time.perf_counter()
+            document, parse_mode = await self._async_parse(entry["text"], entry["content_length"], spec.plan)
+            spec.etag = entry.get("etag")
+            spec.last_modified = entry.get("last_modified")
+            spec.body_hash = entry.get("body_hash")
+            results[spec.key] = RequestResult(
+                document=document,
+                status=entry["status"],
+                headers=self._retained_headers(entry["headers"]),
+                content_type=entry["content_type"],
+                content_length=entry["content_length"],
+                source="persistent_cache",
+                timings={"parse": round((time.perf_counter() - parse_start) * 1000, 2)},
+                parse_count=document.parse_count,
+                parse_mode=parse_mode,
+            )
+        
+        primary = results.pop("")
+        if primary is None:
+            return False
+        data = replace(primary, requests=results) if results else primary
+        
+        self.timings = data.timings
+        self.parse_mode = data.parse_mode
+        self.last_update_success_time = dt_util.parse_datetime(cached.get("saved") or "")
+        self.async_set_updated_data(data)
+        _LOGGER.debug("Restored cached responses for %s", self.config_entry.title)
+        return True
+
+    @callback
+    def _cache_data(self) -> dict[str, Any]:
+        """Return the responses to persist (called when the delayed save runs).
+
+        Bodies released by compact retention or streaming are not cached.
+        """
+        responses: dict[str, Any] = {}
+        for spec in self.requests:
+            result = self.get_result(spec.key)
+            if result is None or spec.streaming or not result.document.text:
+                continue
+            responses[spec.key] = {
+                "url": spec.url,
+                "status": result.status,
+                "headers": dict(result.headers),
+                "content_type": result.content_type,
+                "text": result.document.text,
+                "content_length": result.content_length,
+                "body_hash": spec.body_hash,
+                "etag": spec.etag,
+                "last_modified": spec.last_modified,
+            }
+        saved = self.last_update_success_time
+        return {
+            "saved": saved.isoformat() if saved else None,
+            "requests": responses,
+        }
+
+    def _adapt_interval(self, changed: bool | None) -> None:
+        """Move the polling interval toward how often the response changes.
+
+        A change halves the interval, an unchanged response grows it by a
+        quarter, so it settles where roughly one poll in four sees a change.
+        Failures (changed is None) double it; the first success afterwards
+        returns to the interval used before the failures.
+        """
+        if not self.adaptive_interval:
+            return
+        
+        current = self.update_interval.total_seconds()
+        if changed is None:
+            if self._interval_before_errors is None:
+                self._interval_before_errors = current
+            new = current * 2
+        else:
+            if self._interval_before_errors is not None:
+                current = self._interval_before_errors
+                self._interval_before_errors = None
+            self.change_rate = round(0.8 * self.change_rate + 0.2 * changed, 3)
+            new = current / 2 if changed else current * 1.25
+        
+        new = min(max(new, self.min_scan_interval), self.max_scan_interval)
+        self.update_interval = timedelta(seconds=round(new, 1))
+
+    async def _async_update_data(self) -> RequestResult:
+        """Fetch data from the HTTP endpoint(s)."""
+        if not self.breaker.allow_request():
+            # Endpoint is down: do not spend a socket and a timeout on it
+            raise UpdateFailed(
+                f"Circuit open after {self.breaker.failures} failures, "
+                f"next retry at {self.breaker.next_retry.isoformat()}"
+            )
+        
+        try:
+            data = await self._async_fetch_all()
+        except UpdateFailed as err:
+            backoff = self.breaker.record_failure()
+            if backoff is not None:
+                _LOGGER.warning(
+                    "%s: %s; pausing requests for %.0f seconds",
+                    self.config_entry.title,
+                    err,
+                    backoff,
+                )
+            self._adapt_interval(None)
+            raise
+        
+        if self.breaker.record_success():
+            _LOGGER.info("%s: endpoint recovered", self.config_entry.title)
+        
+        results = [data, *(data.requests or {}).values()]
+        changed = any(result is not None and not result.unchanged for result in results)
+        if self.data is not None:
+            # The first response has nothing to compare with
+            self._adapt_interval(changed)
+        
+        self.timings = data.timings
+        self.timing_stats.record_all(self.timings)
+        self.parse_mode = data.parse_mode
+        
+        # Update last success time
+        self.last_update_success_time = dt_util.now()
+        
+        # Persist changed responses (writes are batched by the store)
+        if self._store is not None and changed:
+            self._store.async_delay_save(self._cache_data, CACHE_SAVE_DELAY)
+        
+        return data
+
+    async def _async_fetch_all(self) -> RequestResult:
+        """Fetch every request of this entry."""
+        if self.connection_pool:
+            # Dedicated pool shared by entries with the same pool settings
+            session = self.pools.async_get_session(
+                self.config_entry.entry_id,
+                self.verify_ssl,
+                self.pool_limit_per_host,
+                self.dns_cache_ttl,
+                self.keepalive_timeout,
+            )
+        else:
+            session = async_get_clientsession(self.hass, verify_ssl=self.verify_ssl)
+        
+        if len(self.requests) == 1:
+            data = await self._async_fetch(session, self.requests[0])
+        else:
+            # Batch: fetch every request concurrently under one tick, bounded fan-out
+            semaphore = asyncio.Semaphore(self.batch_concurrency)
+            
+            async def _async_fetch_limited(spec: RequestSpec) -> RequestResult:
+                async with semaphore:
+                    return await self._async_fetch(session, spec)
+            
+            batch_start = time.perf_counter()
+            results = await asyncio.gather(
+                *(_async_fetch_limited(spec) for spec in self.requests),
+                return_exceptions=True,
+            )
+            if isinstance(results[0], BaseException):
+                raise results[0]
+            
+            requests: dict[str, RequestResult | None] = {}
+            for spec, result in zip(self.requests[1:], results[1:]):
+                if isinstance(result, BaseException):
+                    _LOGGER.warning("Batch request '%s' failed: %s", spec.key, result)
+                    requests[spec.key] = None
+                else:
+                    requests[spec.key] = result
+            data = replace(
+                results[0],
+                requests=requests,
+                timings={
+                    **results[0].timings,
+                    "batch": round((time.perf_counter() - batch_start) * 1000, 2),
+                },
+            )
+        
+        return data
 
 
 class HttpRequestSensor(CoordinatorEntity, SensorEntity):
     """Representation of a HTTP Request sensor."""
 
     _attr_has_entity_name = True
+    # Bulky, frequently changing attributes stay out of the recorder database
+    _unrecorded_attributes = frozenset({"text_matches", "sensor_update", "truncated_attributes"})
 
     def __init__(
         self,
@@ -251,6 +1085,44 @@ class HttpRequestSensor(CoordinatorEntity, SensorEntity):
         self._custom_attributes = {}
         self._last_update = None  # Last sensor update time
         self._state_restored = False  # Flag to check if state has been restored
+        
+        # Request of a batch entry this sensor reads from ('' is the entry's own)
+        self._request_key = sensor_config.get(CONF_REQUEST_KEY, "")
+        
+        # Document the cached extraction (value, value_json) was computed from
+        self._extracted_document: ResponseDocument | None = None
+        self._extracted_values: tuple[Any, Any] = (None, None)
+        # Document and availability of the last rendered state
+        self._rendered_document: ResponseDocument | None = None
+        self._rendered_available: bool | None = None
+        # Value, availability and attributes of the last state write
+        self._last_written: tuple[Any, ...] | None = None
+        
+        # Key of this sensor's value in the document's batch HTML extraction
+        self._html_spec = html_spec_from_config(sensor_config)
+        
+        # Regex compiled once (shared with the coordinator's parse stage)
+        if regex := sensor_config.get(CONF_TEXT_REGEX):
+            try:
+                compile_regex(regex)
+            except ValueError as err:
+                _LOGGER.error("Invalid regex for sensor %s: %s", sensor_name, err)
+        
+        # JSON path compiled once into an accessor
+        self._json_path = None
+        if json_path := sensor_config.get(CONF_JSON_PATH):
+            try:
+                self._json_path = compile_json_path(json_path)
+            except ValueError as err:
+                _LOGGER.error("Invalid JSON path for sensor %s: %s", sensor_name, err)
+        
+        # Templates compiled once per sensor config; an options change reloads the entry
+        self._value_template = compile_template(
+            coordinator.hass, sensor_config.get(CONF_VALUE_TEMPLATE)
+        )
+        self._attributes_template = compile_attributes_template(
+            coordinator.hass, sensor_config.get(CONF_ATTRIBUTES_TEMPLATE)
+        )
 
     @property
     def native_value(self) -> Any:
@@ -260,17 +1132,23 @@ class HttpRequestSensor(CoordinatorEntity, SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any] | None:
         """Return the state attributes."""
-        if self.coordinator.data is None:
+        response_data = self.coordinator.get_result(self._request_key)
+        if response_data is None:
             return None
-            
-        response_data = self.coordinator.data
         
         attributes = {
             "sensor_index": self._idx,
             "sensor_name": self._sensor_config.get("name", DEFAULT_SENSOR_NAME),
-            "sensor_update": dt_util.now(),  # Always update to current time
         }
         
+        # Time of the last computed update (opt-in: it makes every state write unique)
+        if self.coordinator.sensor_update_attribute:
+            attributes["sensor_update"] = self._last_update
+        
+        # Request this sensor reads from in a batch entry
+        if self._request_key:
+            attributes["request_key"] = self._request_key
+        
         # Add text matches for text type with regex
         if self.coordinator.response_type == "text":
             if self._text_matches:
@@ -300,80 +1178,58 @@ class HttpRequestSensor(CoordinatorEntity, SensorEntity):
         # Add custom attributes
         attributes.update(self._custom_attributes)
         
-        return attributes
+        # Keep the recorded attributes within the entity's size budget
+        return apply_attribute_budget(
+            attributes, self.coordinator.attribute_budget, ("sensor_index", "sensor_name")
+        )
 
-    async def async_update(self) -> None:
-        """Update the sensor."""
-        await super().async_update()
+    def _extract(self, document: ResponseDocument) -> tuple[Any, Any]:
+        """Extract this sensor's value and value_json from the shared document."""
+        response_text = document.text
         
-        # Try to restore the sensor's last state value on first update
-        if not self._state_restored and self.entity_id:
-            state = self.hass.states.get(self.entity_id)
-            if state and state.state not in ["unknown", "unavailable", None]:
-                self._last_valid_state_value = state.state
-            self._state_restored = True
-        
-        if self.coordinator.data is None:
-            if not self._sensor_config.get(CONF_KEEP_LAST_VALUE, False):
-                self._parsed_value = None
-                self._text_matches = None
-                self._text_total_count = 0
-                self._custom_attributes = {}
-            return
-        
-        response_data = self.coordinator.data
-        
-        # Get raw response text for 'response' variable
-        response_text = response_data.get("text", "")
-        
-        # Parse response as JSON if possible for 'response' variable
-        response_value = response_text
-        if response_text:
-            try:
-                response_value = json.loads(response_text)
-            except json.JSONDecodeError:
-                # Keep as text if not valid JSON
-                response_value = response_text
-        
-        # Store original parsed values for templates
         value = None  # The main value variable
         value_json = None  # JSON parsed version of value
         
         # Parse based on response type
         if self.coordinator.response_type == "json":
             # For JSON sensor, parse JSON path if specified
-            if json_path := self._sensor_config.get(CONF_JSON_PATH):
-                # Extract value using JSON path
-                json_result = parse_json(response_value, json_path)
+            if self._sensor_config.get(CONF_JSON_PATH):
+                # Extract value using the compiled JSON path on the already parsed tree
+                json_result = None
+                if self._json_path is not None:
+                    json_result = document.resolve_json_path(self._json_path)
                 # Convert to string for value variable
                 if json_result is not None:
-                    value = json.dumps(json_result) if not isinstance(json_result, str) else json_result
+                    if isinstance(json_result, str):
+                        value = json_result
+                    else:
+                        value = json.dumps(json_result)
+                        value_json = json_result  # Already parsed, no need to load it back
                 else:
                     value = None
             else:
                 # No JSON path, use full response as text
                 value = response_text
         elif self.coordinator.response_type == "html":
-            html_value_type = self._sensor_config.get(CONF_HTML_VALUE_TYPE, "value")
-            attr_name = self._sensor_config.get(CONF_HTML_ATTR_NAME)
-            
-            # Parse value based on value type for sensor state
-            value = parse_html(
-                response_text,
-                self._sensor_config.get(CONF_HTML_SELECTOR, ""),
-                html_value_type,
-                attr_name
-            )
+            # Value was resolved by the coordinator's single-pass extraction
+            if self._html_spec is not None:
+                value = document.html_values.get(self._html_spec)
+            else:
+                value = None
         elif self.coordinator.response_type == "text":
             if regex := self._sensor_config.get(CONF_TEXT_REGEX):
-                # Get ALL matches for template variable
-                all_matches = parse_text_all(
-                    response_text,
-                    regex,
-                    None  # No limit for template variable
-                )
-                # Store total count
-                self._text_total_count = len(all_matches) if all_matches else 0
+                # Matches for the template variable and their total count (resolved in the
+                # parse stage; only as many matches as the sensors need are built)
+                if regex in document.text_matches:
+                    all_matches = document.text_matches[regex]
+                    self._text_total_count = document.text_counts.get(regex, 0)
+                else:
+                    all_matches, self._text_total_count = match_text(
+                        response_text,
+                        regex,
+                        self.coordinator.text_match_limit,
+                        self.coordinator.regex_timeout,
+                    )
                 
                 # Get matches up to configured count for attribute and state
                 group_count = self._sensor_config.get(CONF_TEXT_GROUP_COUNT, DEFAULT_TEXT_GROUP_COUNT)
@@ -393,17 +1249,66 @@ class HttpRequestSensor(CoordinatorEntity, SensorEntity):
             value = response_text
         
         # Check if value is JSON parseable for value_json variable
-        if value is not None:
-            try:
-                if isinstance(value, str):
-                    value_json = json.loads(value)
-                elif isinstance(value, list):
-                    # For arrays, keep as is
-                    value_json = value
-                else:
+        if value is not None and value_json is None:
+            if value is response_text:
+                # Full body: reuse the document's parse instead of parsing again
+                value_json = document.json
+            else:
+                try:
+                    if isinstance(value, str):
+                        value_json = json.loads(value)
+                    elif isinstance(value, list):
+                        # For arrays, keep as is
+                        value_json = value
+                    else:
+                        value_json = None
+                except (json.JSONDecodeError, TypeError):
                     value_json = None
-            except (json.JSONDecodeError, TypeError):
-                value_json = None
+        
+        return value, value_json
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial state from the data the coordinator already has."""
+        await super().async_added_to_hass()
+        
+        # Try to restore the sensor's last state value before the first render
+        if not self._state_restored and self.entity_id:
+            state = self.hass.states.get(self.entity_id)
+            if state and state.state not in ["unknown", "unavailable", None]:
+                self._last_valid_state_value = state.state
+            self._state_restored = True
+        
+        self._update_from_coordinator()
+        self._rendered_available = self.available
+        self._last_written = self._written_state()
+
+    @callback
+    def _update_from_coordinator(self) -> None:
+        """Parse the coordinator's current result into this sensor's state."""
+        render_start = time.perf_counter()
+        response_data = self.coordinator.get_result(self._request_key)
+        if response_data is None:
+            if not self._sensor_config.get(CONF_KEEP_LAST_VALUE, False):
+                self._parsed_value = None
+                self._text_matches = None
+                self._text_total_count = 0
+                self._custom_attributes = {}
+            return
+        
+        document = response_data.document
+        
+        # Shared 'response' variable (JSON if parseable, otherwise text)
+        response_value = document.response
+        
+        # Unchanged body: templates and state were already computed for this document
+        if self.coordinator.skip_unchanged and document is self._rendered_document:
+            return
+        
+        # Extract only when the document changed; a 304 reuses the previous document
+        if document is not self._extracted_document:
+            self._extracted_values = self._extract(document)
+            self._extracted_document = document
+        value, value_json = self._extracted_values
         
         # Determine default sensor state based on response type
         if self.coordinator.response_type == "text" and self._sensor_config.get(CONF_TEXT_REGEX):
@@ -414,18 +1319,17 @@ class HttpRequestSensor(CoordinatorEntity, SensorEntity):
             default_state = value
         
         # Apply value template if configured
-        template_str = self._sensor_config.get(CONF_VALUE_TEMPLATE)
-        if template_str:
+        if self._value_template is not None:
             template_vars = {
                 "response": response_value,  # Response in JSON structure if parseable, otherwise text
                 "value": value,  # Parsed value based on sensor type (stays unchanged)
                 "value_json": value_json,  # JSON parsed version of value if available (stays unchanged)
-                "status": response_data.get("status"),
+                "status": response_data.status,
             }
             try:
-                template_result = await render_template(
+                template_result = render_template(
                     self.hass,
-                    template_str,
+                    self._value_template,
                     template_vars
                 )
                 # Check if keep_last_value is enabled and template result is invalid
@@ -486,19 +1390,106 @@ class HttpRequestSensor(CoordinatorEntity, SensorEntity):
                 delattr(self, '_attr_state_class')
         
         # Apply attributes template if configured
-        attributes_template_str = self._sensor_config.get(CONF_ATTRIBUTES_TEMPLATE)
-        if attributes_template_str:
+        if self._attributes_template:
             # Use the original value and value_json for attributes template
             template_vars = {
                 "response": response_value,  # Response in JSON structure if parseable, otherwise text
                 "value": value,  # Original parsed value (unchanged)
                 "value_json": value_json,  # JSON parsed version of original value (unchanged)
-                "status": response_data.get("status"),
+                "status": response_data.status,
             }
-            self._custom_attributes = await render_attributes_template(
+            self._custom_attributes = render_attributes_template(
                 self.hass,
-                attributes_template_str,
+                self._attributes_template,
                 template_vars
             )
         else:
             self._custom_attributes = {}
+        
+        self._rendered_document = document
+        # Extraction and template rendering time of this sensor (ms), summed per update
+        self.coordinator.render_time = (self.coordinator.render_time or 0.0) + (
+            time.perf_counter() - render_start
+        ) * 1000
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Parse the new coordinator result and write the state in the same tick."""
+        data = self.coordinator.get_result(self._request_key)
+        if (
+            self.coordinator.skip_unchanged
+            and data is not None
+            and data.unchanged
+            and data.document is self._rendered_document
+            and self.available == self._rendered_available
+        ):
+            # Body unchanged since the last write: skip the redundant state write
+            return
+        self._update_from_coordinator()
+        self._rendered_available = self.available
+        
+        if self.coordinator.write_changes_only:
+            written = self._written_state()
+            if written == self._last_written:
+                # Same value and attributes as the last write: nothing to record
+                return
+            self._last_written = written
+        super()._handle_coordinator_update()
+
+    def _written_state(self) -> tuple[Any, ...]:
+        """Return what a state write would record, without the update timestamp."""
+        attributes = self.extra_state_attributes
+        if attributes is not None:
+            attributes = {
+                key: value for key, value in attributes.items() if key != "sensor_update"
+            }
+        return (
+            self.native_value,
+            self.available,
+            attributes,
+            getattr(self, "_attr_state_class", None),
+        )
+
+
+class HttpRequestTimingSensor(CoordinatorEntity, SensorEntity):
+    """Diagnostic sensor with the rolling median time of one refresh stage."""
+
+    _attr_has_entity_name = True
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _unrecorded_attributes = frozenset({"count", "p90", "p99", "max"})
+
+    def __init__(
+        self,
+        coordinator: HttpRequestDataUpdateCoordinator,
+        config_entry: ConfigEntry,
+        stage: str,
+    ) -> None:
+        """Initialize the timing sensor."""
+        super().__init__(coordinator)
+        self._stage = stage
+        self._attr_unique_id = f"{config_entry.entry_id}_timing_{stage}"
+        self._attr_name = f"{stage.capitalize()} time"
+        self._attr_device_info = DeviceInfo(
+            identifiers={(DOMAIN, config_entry.entry_id)},
+            name=config_entry.data.get("service_name", "HTTP Request"),
+            manufacturer=MANUFACTURER,
+            model=MODEL,
+            entry_type=dr.DeviceEntryType.SERVICE,
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the median time of the stage (ms)."""
+        stats = self.coordinator.timing_stats.percentiles(self._stage)
+        return stats["p50"] if stats else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the sample count, p90, p99 and max of the stage."""
+        stats = self.coordinator.timing_stats.percentiles(self._stage)
+        if stats is None:
+            return None
+        return {key: value for key, value in stats.items() if key != "p50"}
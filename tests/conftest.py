@@ -0,0 +1,30 @@
+"""Shared fixtures for the HTTP Request tests.
+
+Run with (tests/pytest.ini sets the asyncio mode the hass fixture needs):
+
+    pip install pytest-homeassistant-custom-component
+    pytest tests
+"""
+from __future__ import annotations
+
+from pathlib import Path
+import sys
+
+import pytest
+
+try:
+    import pytest_homeassistant_custom_component  # noqa: F401
+except ImportError:
+    # Nothing to run without the Home Assistant test plugin
+    collect_ignore_glob = ["test_*.py"]
+
+# Make custom_components importable without installing the integration
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Enable loading the integration from custom_components."""
+    yield
@@ -0,0 +1,109 @@
+"""Tests of the coordinator's refreshes that reuse the previous response."""
+from __future__ import annotations
+
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.http_request.const import (
+    CONF_CONDITIONAL_REQUESTS,
+    CONF_METHOD,
+    CONF_REQUEST_JITTER,
+    CONF_RESPONSE_TYPE,
+    CONF_SCAN_INTERVAL,
+    CONF_SKIP_UNCHANGED,
+    CONF_URL,
+    DOMAIN,
+)
+
+BODY = '{"main": {"temp": 21.5}}'
+ETAG = '"v1"'
+
+
+@pytest.fixture
+async def server(socket_enabled):
+    """Serve the same body on every request, with an ETag on /etag."""
+
+    async def handle(request: web.Request) -> web.Response:
+        if request.match_info["path"] == "etag":
+            if request.headers.get("If-None-Match") == ETAG:
+                return web.Response(status=304, headers={"ETag": ETAG})
+            return web.Response(text=BODY, content_type="application/json", headers={"ETag": ETAG})
+        return web.Response(text=BODY, content_type="application/json")
+
+    app = web.Application()
+    app.router.add_get("/{path}", handle)
+    server = TestServer(app)
+    await server.start_server()
+    yield server
+    await server.close()
+
+
+async def _async_setup_entry(
+    hass: HomeAssistant, server: TestServer, path: str, options: dict[str, Any]
+) -> MockConfigEntry:
+    """Set up an entry with one sensor reading the served body."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="Test",
+        data={
+            "service_name": "Test",
+            CONF_URL: str(server.make_url(f"/{path}")),
+            CONF_METHOD: "GET",
+            CONF_RESPONSE_TYPE: "json",
+            # Refreshes are driven by the test, not the interval
+            CONF_SCAN_INTERVAL: 86400,
+            CONF_REQUEST_JITTER: 0,
+            "sensors": [{"name": "Temperature", "json_path": "main.temp"}],
+            **options,
+        },
+    )
+    entry.add_to_hass(hass)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+def _info_attributes(hass: HomeAssistant) -> dict[str, Any]:
+    """Return the attributes of the entry's info entity."""
+    (state,) = hass.states.async_all("binary_sensor")
+    return dict(state.attributes)
+
+
+@pytest.mark.parametrize(
+    ("path", "options", "flag"),
+    [
+        ("etag", {CONF_CONDITIONAL_REQUESTS: True}, "not_modified"),
+        ("plain", {CONF_SKIP_UNCHANGED: True}, "unchanged"),
+    ],
+    ids=["not_modified", "unchanged"],
+)
+async def test_reused_response_reports_no_parse(
+    hass: HomeAssistant, server: TestServer, path: str, options: dict[str, Any], flag: str
+) -> None:
+    """A refresh that reuses the previous document reports that it parsed nothing."""
+    entry = await _async_setup_entry(hass, server, path, options)
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    assert coordinator.data.parse_count == 1
+    assert coordinator.parse_mode == "inline"
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert getattr(coordinator.data, flag)
+    assert coordinator.data.parse_count == 0
+    assert coordinator.data.parse_mode == "skipped"
+    assert coordinator.parse_mode == "skipped"
+    attributes = _info_attributes(hass)
+    assert attributes["parse_count"] == 0
+    assert attributes["parse_mode"] == "skipped"
+    (sensor,) = hass.states.async_all("sensor")
+    assert sensor.state == "21.5"
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()